@@ -445,6 +445,8 @@ class HealthChecker:
         }
 
         all_passed = True
+        # (check_type, check_result, check_details) rows, stored together at the end
+        checks = []
 
         # Link check
         if "link" in check_types:
@@ -458,17 +460,15 @@ class HealthChecker:
             if not link_result.is_accessible:
                 all_passed = False
 
-            # Store in database
             check_status = "passed" if link_result.is_accessible else "failed"
-            self.tracker.add_health_check(
-                skill_id=skill.file_hash,
-                check_type="link",
-                check_result=check_status,
-                check_details=json.dumps({
+            checks.append((
+                "link",
+                check_status,
+                json.dumps({
                     "status_code": link_result.status_code,
                     "error": link_result.error,
-                })
-            )
+                }),
+            ))
 
         # Format check (requires reading local file)
         if "format" in check_types and skill.local_path:
@@ -486,15 +486,14 @@ class HealthChecker:
                     if not format_result.is_valid:
                         all_passed = False
 
-                    self.tracker.add_health_check(
-                        skill_id=skill.file_hash,
-                        check_type="format",
-                        check_result="passed" if format_result.is_valid else "failed",
-                        check_details=json.dumps({
+                    checks.append((
+                        "format",
+                        "passed" if format_result.is_valid else "failed",
+                        json.dumps({
                             "has_frontmatter": format_result.has_frontmatter,
                             "missing_fields": format_result.missing_fields,
-                        })
-                    )
+                        }),
+                    ))
             except Exception as e:
                 logger.warning(f"Could not check format for {skill.file_hash}: {e}")
 
@@ -518,15 +517,14 @@ class HealthChecker:
             elif staleness_result.is_stale:
                 check_status = "warning"
 
-            self.tracker.add_health_check(
-                skill_id=skill.file_hash,
-                check_type="staleness",
-                check_result=check_status,
-                check_details=json.dumps({
+            checks.append((
+                "staleness",
+                check_status,
+                json.dumps({
                     "days_since_update": staleness_result.days_since_update,
                     "repo_archived": staleness_result.repo_archived,
-                })
-            )
+                }),
+            ))
 
         # Syntax check
         if "syntax" in check_types and skill.local_path:
@@ -542,15 +540,17 @@ class HealthChecker:
                     if syntax_errors:
                         all_passed = False
 
-                    self.tracker.add_health_check(
-                        skill_id=skill.file_hash,
-                        check_type="syntax",
-                        check_result="passed" if not syntax_errors else "warning",
-                        check_details=json.dumps({"errors": syntax_errors})
-                    )
+                    checks.append((
+                        "syntax",
+                        "passed" if not syntax_errors else "warning",
+                        json.dumps({"errors": syntax_errors}),
+                    ))
             except Exception as e:
                 logger.warning(f"Could not check syntax for {skill.file_hash}: {e}")
 
+        # Store in database
+        self.tracker.add_health_checks(skill.file_hash, checks)
+
         results["overall_status"] = "passed" if all_passed else "failed"
         return results
 
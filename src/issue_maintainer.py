@@ -144,12 +144,13 @@ class IssueMaintainerAgent:
                     labels=json.dumps(labels),
                 )
 
-                # Track in database
-                self.tracker.add_issue(issue_info)
                 new_issues.append(issue_info)
 
                 logger.info(f"Found new issue #{issue.number}: {issue.title}")
 
+            # Track all new ones in database in a single transaction
+            self.tracker.add_issues(new_issues)
+
             return new_issues
 
         except Exception as e:
@@ -333,10 +334,12 @@ class IssueMaintainerAgent:
         results["fetched"] = len(new_issues)
 
         # Get pending issues from database
-        pending_issues = self.tracker.get_pending_issues("pending")
+        # (new issues may be among them, so max_issues rows is always enough)
+        pending_issues = self.tracker.get_pending_issues("pending", limit=max_issues)
 
         # Combine and limit
-        all_pending = new_issues + [i for i in pending_issues if i not in new_issues]
+        new_numbers = {i.issue_number for i in new_issues}
+        all_pending = new_issues + [i for i in pending_issues if i.issue_number not in new_numbers]
         all_pending = all_pending[:max_issues]
 
         for issue_info in all_pending:
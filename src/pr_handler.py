@@ -346,12 +346,13 @@ class PRHandler:
                     processing_status="pending",
                 )
 
-                # Track in database
-                self.tracker.add_pr(pr_info)
                 new_prs.append(pr_info)
 
                 logger.info(f"Found new PR #{pr.number}: {pr.title}")
 
+            # Track all new ones in database in a single transaction
+            self.tracker.add_prs(new_prs)
+
             return new_prs
 
         except Exception as e:
@@ -476,10 +477,12 @@ class PRHandler:
         results["fetched"] = len(new_prs)
 
         # Get pending PRs from database
-        pending_prs = self.tracker.get_pending_prs("pending")
+        # (new PRs may be among them, so max_prs rows is always enough)
+        pending_prs = self.tracker.get_pending_prs("pending", limit=max_prs)
 
         # Combine and limit
-        all_pending = new_prs + [p for p in pending_prs if p not in new_prs]
+        new_numbers = {p.pr_number for p in new_prs}
+        all_pending = new_prs + [p for p in pending_prs if p.pr_number not in new_numbers]
         all_pending = all_pending[:max_prs]
 
         for pr_info in all_pending:
@@ -8,6 +8,7 @@ This module provides functionality to:
 """
 
 import logging
+import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -216,18 +217,20 @@ class RepoSyncer:
         Returns:
             List of repository full names that need syncing
         """
-        skills = self.tracker.get_all_processed()
-
         # Group by source repo
         repos: Dict[str, Dict[str, Any]] = {}
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
 
-        for skill in skills:
-            if skill.source_repo not in repos:
-                repos[skill.source_repo] = {
-                    'last_synced': skill.repo_last_synced or skill.processed_at,
-                    'repo_stars': skill.repo_stars or 0,
-                }
+        try:
+            for skill in self.tracker.iter_all_processed():
+                if skill.source_repo not in repos:
+                    repos[skill.source_repo] = {
+                        'last_synced': skill.repo_last_synced or skill.processed_at,
+                        'repo_stars': skill.repo_stars or 0,
+                    }
+        except sqlite3.Error as e:
+            logger.error(f"Database query error: {e}")
+            return []
 
         stale_repos = []
         for repo_name, info in repos.items():
@@ -258,12 +261,15 @@ class RepoSyncer:
         if threshold is None:
             threshold = self.DEFAULT_ACTIVE_STARS_THRESHOLD
 
-        skills = self.tracker.get_all_processed()
         active_repos = set()
 
-        for skill in skills:
-            if skill.repo_stars and skill.repo_stars >= threshold:
-                active_repos.add(skill.source_repo)
+        try:
+            for skill in self.tracker.iter_all_processed():
+                if skill.repo_stars and skill.repo_stars >= threshold:
+                    active_repos.add(skill.source_repo)
+        except sqlite3.Error as e:
+            logger.error(f"Database query error: {e}")
+            return []
 
         return sorted(active_repos)
 
@@ -305,13 +305,15 @@ def run_pipeline(push_to_github: bool = True, force_rebuild: bool = False, batch
                 continue
 
             repo_skills = []
-            for file_info in skill_files:  # Process all skill files from repository
-                skill_content = fetcher.fetch_skill_file(repo_info, file_info)
-                if not skill_content:
-                    continue
-
+            repo_tracked = []  # SkillInfo records, written to the tracker once per repo
+            repo_hashes = set()
+            # Fetch all of the repository's skill files concurrently
+            for skill_content in fetcher.fetch_multiple_skills(repo_info, skill_files):
                 # Check if already processed (skip only on incremental builds)
-                if not force_rebuild and tracker.is_already_processed(skill_content.file_hash):
+                if not force_rebuild and (
+                    skill_content.file_hash in repo_hashes
+                    or tracker.is_already_processed(skill_content.file_hash)
+                ):
                     continue
 
                 # Analyze skill
@@ -338,8 +340,6 @@ def run_pipeline(push_to_github: bool = True, force_rebuild: bool = False, batch
                     repo_stars=repo_info.stars,
                 )
                 repo_skills.append(skill)
-                batch_skills.append(skill)
-                all_new_skills.append(skill)
 
                 # Track as processed
                 from datetime import datetime
@@ -357,7 +357,16 @@ def run_pipeline(push_to_github: bool = True, force_rebuild: bool = False, batch
                     source_updated_at=skill_content.updated_at,
                     repo_stars=repo_info.stars,
                 )
-                tracker.mark_as_processed(skill_info)
+                repo_tracked.append(skill_info)
+                repo_hashes.add(skill_info.file_hash)
+
+            # Queue the repo's skills only once they are tracked, so an error
+            # mid-repo never leaves pushed-but-untracked skills behind
+            if repo_tracked and tracker.mark_many_as_processed(repo_tracked) == 0:
+                logger.error(f"  Could not track skills from {repo_info.full_name}, skipping repository")
+                continue
+            batch_skills.extend(repo_skills)
+            all_new_skills.extend(repo_skills)
 
             total_skills_found += len(repo_skills)
             logger.info(f"  Found {len(repo_skills)} new skills from {repo_info.full_name}")
@@ -3,15 +3,27 @@
 import json
 import logging
 import re
+from array import array
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from .config import Config
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 logger = logging.getLogger(__name__)
 
+# Characters stripped from candidate description paragraphs
+_DESC_STRIP = str.maketrans("", "", "#*-`")
+
+_PARAGRAPH_BREAK = re.compile(r"\n\n+")
+
 
 @dataclass
 class SkillMetadata:
@@ -138,10 +150,14 @@ class SkillAnalyzer:
             SkillMetadata if successful, None otherwise
         """
         try:
+            # Lowered once and shared by the keyword scan; regex helpers keep
+            # the original content so extracted values preserve their case
+            content_lower = content.lower()
+
             # Extract metadata from content
             name = self._extract_name(content, source_repo, source_path)
             description = self._extract_description(content)
-            category, subcategory = self._categorize_skill(content)
+            category, subcategory = self._categorize_skill(content_lower)
             tags = self._extract_tags(content, category)
             primary_purpose = self._extract_purpose(content, description)
 
@@ -227,55 +243,60 @@ class SkillAnalyzer:
             return yaml_match.group(1).strip()
 
         # Look for first paragraph
-        paragraphs = re.split(r'\n\n+', content)
-        for para in paragraphs:
+        for para in _iter_paragraphs(content):
             # Skip YAML and headings
             if para.strip().startswith('---') or para.strip().startswith('#'):
                 continue
             # Get first meaningful paragraph
-            text = re.sub(r'[#*\-`]', '', para).strip()
+            text = para.translate(_DESC_STRIP).strip()
             if len(text) > 20 and len(text) < 300:
                 return text
 
         return "AI skill for automation and assistance"
 
-    def _categorize_skill(self, content: str) -> tuple[str, str]:
+    def _categorize_skill(self, content_lower: str) -> tuple[str, str]:
         """Categorize skill based on content analysis.
 
         Args:
-            content: Skill file content
+            content_lower: Lowercased skill file content
 
         Returns:
             Tuple of (category, subcategory)
         """
-        content_lower = content.lower()
+        # Collect matched keywords; each keyword counts once regardless of occurrences
+        if _KEYWORD_AUTOMATON is not None:
+            matched = {index for _, index in _KEYWORD_AUTOMATON.iter(content_lower)}
+        else:
+            matched = {
+                index for index, (keyword, _) in enumerate(_KEYWORDS)
+                if keyword in content_lower
+            }
+
+        category_counts = array("i", [0]) * len(_CATEGORIES)
+        subcategory_counts = [array("i", [0]) * len(subs) for subs in _SUBCATEGORIES]
+        for index in matched:
+            for cat_idx, sub_idx in _KEYWORDS[index][1]:
+                if sub_idx < 0:
+                    category_counts[cat_idx] += 1
+                else:
+                    subcategory_counts[cat_idx][sub_idx] += 1
 
         # Score each category
         best_category = "other"
         best_subcategory = "general"
         best_score = 0
 
-        for category, patterns in self.CATEGORY_PATTERNS.items():
-            # Score main category
-            category_score = sum(
-                1 for keyword in patterns["keywords"]
-                if keyword in content_lower
-            )
-
-            # Score subcategories
+        for cat_idx, category in enumerate(_CATEGORIES):
+            # Pick the best subcategory, keeping declaration order on ties
             subcategory_score = 0
             best_sub_for_category = "general"
 
-            for subcat, sub_keywords in patterns["subcategories"].items():
-                score = sum(
-                    1 for keyword in sub_keywords
-                    if keyword in content_lower
-                )
+            for sub_idx, score in enumerate(subcategory_counts[cat_idx]):
                 if score > subcategory_score:
                     subcategory_score = score
-                    best_sub_for_category = subcat
+                    best_sub_for_category = _SUBCATEGORIES[cat_idx][sub_idx]
 
-            total_score = category_score + (subcategory_score * 2)
+            total_score = category_counts[cat_idx] + (subcategory_score * 2)
 
             if total_score > best_score:
                 best_score = total_score
@@ -369,3 +390,76 @@ class SkillAnalyzer:
             results.append(metadata)
 
         return results
+
+
+def _iter_paragraphs(content: str) -> Iterator[str]:
+    """Yield blank-line separated paragraphs lazily.
+
+    Produces the same pieces as splitting on _PARAGRAPH_BREAK, but stops
+    doing work as soon as the caller has found what it needs.
+
+    Args:
+        content: Text to split
+
+    Yields:
+        Paragraph strings in order
+    """
+    start = 0
+    for match in _PARAGRAPH_BREAK.finditer(content):
+        yield content[start:match.start()]
+        start = match.end()
+    yield content[start:]
+
+
+def _build_keyword_tables(
+    patterns: dict,
+) -> tuple[tuple[str, ...], tuple[tuple[str, ...], ...], tuple[tuple[str, tuple[tuple[int, int], ...]], ...]]:
+    """Flatten category patterns into index-based lookup tables.
+
+    Args:
+        patterns: Category pattern mapping (see SkillAnalyzer.CATEGORY_PATTERNS)
+
+    Returns:
+        Tuple of (categories, subcategories per category, keywords), where each
+        keyword entry is (keyword, ((category_index, subcategory_index), ...))
+        and a subcategory index of -1 scores for the category itself
+    """
+    categories = tuple(patterns)
+    subcategories = tuple(tuple(p["subcategories"]) for p in patterns.values())
+
+    targets: dict[str, list[tuple[int, int]]] = {}
+    for cat_idx, p in enumerate(patterns.values()):
+        for keyword in p["keywords"]:
+            targets.setdefault(keyword, []).append((cat_idx, -1))
+        for sub_idx, sub_keywords in enumerate(p["subcategories"].values()):
+            for keyword in sub_keywords:
+                targets.setdefault(keyword, []).append((cat_idx, sub_idx))
+
+    keywords = tuple((keyword, tuple(hits)) for keyword, hits in targets.items())
+    return categories, subcategories, keywords
+
+
+def _build_keyword_automaton(keywords: tuple) -> Optional["ahocorasick.Automaton"]:
+    """Build an Aho-Corasick automaton mapping each keyword to its table index.
+
+    Args:
+        keywords: Keyword table from _build_keyword_tables
+
+    Returns:
+        Automaton, or None if pyahocorasick is not installed
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for index, (keyword, _) in enumerate(keywords):
+        automaton.add_word(keyword, index)
+    automaton.make_automaton()
+    return automaton
+
+
+# Category keyword data is static, so flatten it once at import time
+_CATEGORIES, _SUBCATEGORIES, _KEYWORDS = _build_keyword_tables(SkillAnalyzer.CATEGORY_PATTERNS)
+
+# Single automaton over all keywords so categorization is one linear pass
+_KEYWORD_AUTOMATON = _build_keyword_automaton(_KEYWORDS)
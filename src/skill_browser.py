@@ -6,15 +6,37 @@ skills from the X-Skills repository.
 
 import json
 import logging
+import re
+from bisect import bisect_left
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 from difflib import SequenceMatcher
 
 from src.config import Config
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
 
 logger = logging.getLogger(__name__)
 
+# First README line that is neither blank nor a heading, unless a line
+# containing "## Description" comes first
+_README_DESC_RE = re.compile(
+    r"\A(?:(?!.*## Description)(?:#.*|[^\S\n]*)\n)*"
+    r"(?!.*## Description)(?!#)[^\S\n]*(\S.*)"
+)
+
 
 class SkillBrowser:
     """Browse and search skills from X-Skills repository.
@@ -38,33 +60,107 @@ class SkillBrowser:
             "skillflow_repos/X-Skills"
         ))
 
-        # Load skill index
-        self._skill_index: Dict[str, Any] = {}
-        self._load_skill_index()
+    @cached_property
+    def _skill_index(self) -> Dict[str, Any]:
+        """Skill index keyed by file hash, loaded on first access.
 
-    def _load_skill_index(self) -> None:
+        Commands that never query the index (e.g. reading skill content or
+        listing installed skills) don't pay for parsing it.
+        """
+        return self._load_skill_index()
+
+    @cached_property
+    def _records(self) -> List[Dict[str, Any]]:
+        """Index records in index order; positions key all other columns."""
+        return list(self._skill_index.values())
+
+    @cached_property
+    def _lnames(self) -> List[str]:
+        """Lowercased display names, parallel to ``_records``."""
+        return [
+            skill_data.get("display_name", skill_data["name"]).lower()
+            for skill_data in self._records
+        ]
+
+    @cached_property
+    def _lsources(self) -> List[str]:
+        """Lowercased source repositories, parallel to ``_records``."""
+        return [skill_data.get("source_repo", "").lower() for skill_data in self._records]
+
+    @cached_property
+    def _path_index(self) -> Dict[str, int]:
+        """Map "category/name" skill paths to record positions."""
+        path_index: Dict[str, int] = {}
+        for pos, skill_data in enumerate(self._records):
+            path_index.setdefault(f"{skill_data.get('category')}/{skill_data.get('name')}", pos)
+        return path_index
+
+    @cached_property
+    def _tag_index(self) -> Dict[str, List[int]]:
+        """Posting lists mapping each lowercased tag to record positions."""
+        tag_index: Dict[str, List[int]] = {}
+        for pos, skill_data in enumerate(self._records):
+            for tag in self._parse_tags(skill_data.get("tags")):
+                if isinstance(tag, str):
+                    tag_index.setdefault(tag.lower(), []).append(pos)
+        return tag_index
+
+    @cached_property
+    def _category_index(self) -> Dict[Optional[str], List[int]]:
+        """Posting lists mapping each category to record positions."""
+        category_index: Dict[Optional[str], List[int]] = {}
+        for pos, skill_data in enumerate(self._records):
+            category_index.setdefault(skill_data.get("category"), []).append(pos)
+        return category_index
+
+    @cached_property
+    def _tag_vocab(self) -> List[str]:
+        """Sorted list of all lowercased tags."""
+        return sorted(self._tag_index)
+
+    @cached_property
+    def _tag_suffixes(self) -> List[Tuple[str, str]]:
+        """Sorted (suffix, tag) pairs for every suffix of every tag.
+
+        Any substring of a tag is a prefix of one of its suffixes, so
+        substring lookups become bisect range scans.
+        """
+        return sorted(
+            (tag[i:], tag) for tag in self._tag_vocab for i in range(len(tag))
+        )
+
+    def _load_skill_index(self) -> Dict[str, Any]:
         """Load skill index from X-Skills repository.
 
         The .index.json file contains metadata about all skills.
+
+        Returns:
+            Dictionary mapping file hash to skill index record
         """
+        skill_index: Dict[str, Any] = {}
         index_file = self.xskills_dir / ".index.json"
 
         if not index_file.exists():
             logger.warning(f"Skill index not found: {index_file}")
-            return
+            return skill_index
 
         try:
-            with open(index_file, "r") as f:
-                data = json.load(f)
+            with open(index_file, "rb") as f:
+                raw = f.read()
+
+            # orjson parses large indexes several times faster than stdlib json
+            data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
 
             for skill_data in data.get("skills", []):
-                self._skill_index[skill_data["file_hash"]] = skill_data
+                skill_index[skill_data["file_hash"]] = skill_data
 
-            logger.debug(f"Loaded {len(self._skill_index)} skills from index")
+            logger.debug(f"Loaded {len(skill_index)} skills from index")
 
         except (json.JSONDecodeError, IOError) as e:
             logger.error(f"Error loading skill index: {e}")
 
+        return skill_index
+
     def list_skills(
         self,
         category: Optional[str] = None,
@@ -81,11 +177,7 @@ class SkillBrowser:
         """
         skills = []
 
-        for skill_data in self._skill_index.values():
-            # Filter by category
-            if category and skill_data.get("category") != category:
-                continue
-
+        for skill_data in self._iter_skills(category):
             skills.append({
                 "path": f"{skill_data['category']}/{skill_data['name']}",
                 "name": skill_data.get("display_name", skill_data["name"]),
@@ -117,42 +209,53 @@ class SkillBrowser:
 
         results = []
 
-        for skill_data in self._skill_index.values():
-            # Filter by category
-            if category and skill_data.get("category") != category:
-                continue
-
-            # Get searchable text
-            name = skill_data.get("display_name", skill_data["name"]).lower()
-            tags = self._parse_tags(skill_data.get("tags"))
-            source = skill_data.get("source_repo", "").lower()
-
+        # Filter by category; search only walks the lowercased name/source
+        # columns and touches full records for results
+        positions = self._positions(category)
+        records = self._records
+        lnames = self._lnames
+        lsources = self._lsources
+
+        # Count tag hits per skill from the tag posting lists
+        tag_hits: Dict[int, int] = {}
+        for tag in self._matching_tags(query_lower):
+            for pos in self._tag_index[tag]:
+                tag_hits[pos] = tag_hits.get(pos, 0) + 1
+
+        # Every candidate is fuzzy-scored so typo matches without a substring
+        # hit still rank; the batch scorer prunes low scores itself
+        scored = [
+            (pos, query_lower in lnames[pos], query_lower in lsources[pos])
+            for pos in positions
+        ]
+        ratios = _fuzzy_ratios(query_lower, [lnames[pos] for pos, _, _ in scored])
+
+        for (pos, name_hit, src_hit), ratio in zip(scored, ratios):
             # Calculate relevance score
             score = 0
 
             # Exact match in name
-            if query_lower in name:
+            if name_hit:
                 score += 100
 
             # Partial match in name
-            score += SequenceMatcher(None, query_lower, name).ratio() * 50
+            score += ratio * 50
 
             # Match in tags
-            for tag in tags:
-                if query_lower in tag.lower():
-                    score += 30
+            score += tag_hits.get(pos, 0) * 30
 
             # Match in source
-            if query_lower in source:
+            if src_hit:
                 score += 10
 
             if score > 0:
+                skill_data = records[pos]
                 results.append({
                     "path": f"{skill_data['category']}/{skill_data['name']}",
                     "name": skill_data.get("display_name", skill_data["name"]),
                     "category": skill_data.get("category", "N/A"),
                     "description": skill_data.get("description", ""),
-                    "tags": tags,
+                    "tags": self._parse_tags(skill_data.get("tags")),
                     "source": skill_data.get("source_repo", "N/A"),
                     "score": int(score),
                 })
@@ -161,6 +264,70 @@ class SkillBrowser:
         results.sort(key=lambda x: x["score"], reverse=True)
         return results[:limit]
 
+    def _matching_tags(self, query_lower: str) -> set:
+        """Find indexed tags containing the query as a substring.
+
+        Args:
+            query_lower: Lowercased search query
+
+        Returns:
+            Set of matching lowercased tags
+        """
+        if not query_lower:
+            return set(self._tag_vocab)
+
+        matches = set()
+        start = bisect_left(self._tag_suffixes, (query_lower,))
+        for suffix, tag in self._tag_suffixes[start:]:
+            if not suffix.startswith(query_lower):
+                break
+            matches.add(tag)
+        return matches
+
+    def complete_tags(self, prefix: str, limit: int = 10) -> List[str]:
+        """Autocomplete tags starting with a prefix.
+
+        Args:
+            prefix: Tag prefix (case-insensitive)
+            limit: Maximum number of suggestions
+
+        Returns:
+            Sorted list of lowercased tags
+        """
+        prefix = prefix.lower()
+        results = []
+        for tag in self._tag_vocab[bisect_left(self._tag_vocab, prefix):]:
+            if not tag.startswith(prefix) or len(results) >= limit:
+                break
+            results.append(tag)
+        return results
+
+    def _positions(self, category: Optional[str] = None) -> Sequence[int]:
+        """Record positions, optionally restricted to one category.
+
+        Args:
+            category: Category to filter by (all skills if empty)
+
+        Returns:
+            Positions into ``_records`` in index order
+        """
+        if not category:
+            return range(len(self._records))
+        return self._category_index.get(category, [])
+
+    def _iter_skills(self, category: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate index records, optionally restricted to one category.
+
+        Args:
+            category: Category to filter by (all skills if empty)
+
+        Yields:
+            Skill index records in index order
+        """
+        records = self._records
+        for pos in self._positions(category):
+            yield records[pos]
+
     def get_skill_info(self, skill_path: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a skill.
 
@@ -178,38 +345,33 @@ class SkillBrowser:
         category, skill_name = parts
 
         # Find skill in index
-        for skill_data in self._skill_index.values():
-            if (skill_data.get("category") == category and
-                skill_data.get("name") == skill_name):
-
-                # Load description from skill README
-                skill_dir = self.xskills_dir / category / skill_name
-                description = "No description available"
-
-                if skill_dir.exists():
-                    readme_file = skill_dir / "README.md"
-                    if readme_file.exists():
-                        content = readme_file.read_text()
-                        # Extract description
-                        for line in content.split("\n"):
-                            if "## Description" in line:
-                                break
-                            if line.strip() and not line.startswith("#"):
-                                description = line.strip()
-                                break
-
-                return {
-                    "path": skill_path,
-                    "display_name": skill_data.get("display_name", skill_name),
-                    "category": skill_data.get("category", "N/A"),
-                    "source": skill_data.get("source_repo", "N/A"),
-                    "source_url": skill_data.get("source_url", ""),
-                    "tags": self._parse_tags(skill_data.get("tags")),
-                    "description": description,
-                    "created_at": skill_data.get("indexed_at", ""),
-                }
-
-        return None
+        pos = self._path_index.get(skill_path)
+        if pos is None:
+            return None
+        skill_data = self._records[pos]
+
+        # Load description from skill README
+        skill_dir = self.xskills_dir / category / skill_name
+        description = "No description available"
+
+        if skill_dir.exists():
+            readme_file = skill_dir / "README.md"
+            if readme_file.exists():
+                # Extract description
+                match = _README_DESC_RE.match(_read_text_cached(readme_file))
+                if match:
+                    description = match.group(1).strip()
+
+        return {
+            "path": skill_path,
+            "display_name": skill_data.get("display_name", skill_name),
+            "category": skill_data.get("category", "N/A"),
+            "source": skill_data.get("source_repo", "N/A"),
+            "source_url": skill_data.get("source_url", ""),
+            "tags": self._parse_tags(skill_data.get("tags")),
+            "description": description,
+            "created_at": skill_data.get("indexed_at", ""),
+        }
 
     def get_skill_content(self, skill_path: str) -> Optional[str]:
         """Get the full content of a skill.
@@ -233,7 +395,7 @@ class SkillBrowser:
         if not skill_file.exists():
             return None
 
-        return skill_file.read_text()
+        return _read_text_cached(skill_file)
 
     def get_installed_skills(self) -> List[Dict[str, Any]]:
         """Get list of installed skills from Claude Code.
@@ -275,12 +437,10 @@ class SkillBrowser:
         Returns:
             List of category names
         """
-        categories = set()
-
-        for skill_data in self._skill_index.values():
-            categories.add(skill_data.get("category", "other"))
-
-        return sorted(categories)
+        return sorted({
+            category if category is not None else "other"
+            for category in self._category_index
+        })
 
     def get_category_stats(self) -> Dict[str, int]:
         """Get skill count per category.
@@ -290,9 +450,9 @@ class SkillBrowser:
         """
         stats = {}
 
-        for skill_data in self._skill_index.values():
-            category = skill_data.get("category", "other")
-            stats[category] = stats.get(category, 0) + 1
+        for category, positions in self._category_index.items():
+            category = category if category is not None else "other"
+            stats[category] = stats.get(category, 0) + len(positions)
 
         return dict(sorted(stats.items(), key=lambda x: x[1], reverse=True))
 
@@ -312,13 +472,82 @@ class SkillBrowser:
             return tags
 
         if isinstance(tags, str):
-            try:
-                parsed = json.loads(tags)
-                return parsed if isinstance(parsed, list) else []
-            except json.JSONDecodeError:
-                return []
+            return list(_parse_tags_str(tags))
 
         return []
 
 
+def _fuzzy_ratios(query: str, names: List[str]) -> List[float]:
+    """Compute fuzzy similarity between a query and each name.
+
+    Uses RapidFuzz's partial_ratio over the whole batch when available,
+    otherwise falls back to difflib's SequenceMatcher per name.
+
+    Args:
+        query: Lowercased search query
+        names: Lowercased candidate names
+
+    Returns:
+        Similarity per name in the range 0.0-1.0, in input order
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        ratios = [0.0] * len(names)
+        for _, score, index in process.extract(
+            query, names, scorer=fuzz.partial_ratio, limit=None, score_cutoff=20
+        ):
+            ratios[index] = score / 100
+        return ratios
+
+    return [SequenceMatcher(None, query, name).ratio() for name in names]
+
+
+@lru_cache(maxsize=4096)
+def _parse_tags_str(tags: str) -> Tuple[Any, ...]:
+    """Parse a JSON-encoded tag list, memoized by the raw string.
+
+    Index entries often share identical tag strings and the same index is
+    queried repeatedly, so caching avoids re-running json.loads each time.
+
+    Args:
+        tags: JSON string expected to contain a list
+
+    Returns:
+        Tuple of tags (empty if the string is not a JSON list)
+    """
+    try:
+        parsed = json.loads(tags)
+    except json.JSONDecodeError:
+        return ()
+    return tuple(parsed) if isinstance(parsed, list) else ()
+
+
+def _read_text_cached(path: Path) -> str:
+    """Read a text file through a cache keyed by its modification time.
+
+    Args:
+        path: File to read
+
+    Returns:
+        File content
+    """
+    return _read_text(str(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=64)
+def _read_text(path: str, mtime_ns: int) -> str:
+    """Read a text file, memoized per (path, mtime).
+
+    Preview, install and view flows read the same skill files repeatedly;
+    an edit bumps the mtime and so naturally misses the cache.
+
+    Args:
+        path: File path
+        mtime_ns: Modification time in nanoseconds (cache key only)
+
+    Returns:
+        File content
+    """
+    return Path(path).read_text()
+
+
 __all__ = ["SkillBrowser"]
@@ -1,16 +1,21 @@
 """Skill fetching module for cloning and extracting skill files."""
 
+import hashlib
 import logging
 import os
 import shutil
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from git import Repo as GitRepo
-from git import GitCommandError
+from git import GitCommandError, GitError
 
 from .config import Config
 from .github_searcher import FileInfo, RepoInfo
@@ -43,6 +48,21 @@ class SkillFetcher:
         """
         self.config = config
         self._temp_dir: Optional[Path] = None
+        # Serializes temp dir creation and cloning across fetch worker threads
+        self._clone_lock = threading.Lock()
+        # Repositories already cloned into the temp dir, by full name
+        self._cloned_repos: Dict[str, Path] = {}
+
+        # Reuse keep-alive connections to raw.githubusercontent.com across fetches
+        # instead of paying a TCP+TLS handshake per file
+        pool_size = max(self.config.get("fetch.concurrency", 16), 1)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size * 2,
+            max_retries=Retry(total=3, backoff_factor=0.2),
+        )
+        self._session.mount("https://", adapter)
 
     def _get_temp_dir(self) -> Path:
         """Get or create temporary directory for cloning repos.
@@ -65,6 +85,7 @@ class SkillFetcher:
                 logger.warning(f"Could not clean up temp directory: {e}")
             finally:
                 self._temp_dir = None
+                self._cloned_repos.clear()
 
     def fetch_skill_file(self, repo_info: RepoInfo, file_info: FileInfo) -> Optional[SkillContent]:
         """Fetch a skill file from a repository.
@@ -76,6 +97,15 @@ class SkillFetcher:
         Returns:
             SkillContent if successful, None otherwise
         """
+        # Read straight from disk if an earlier file already forced a clone
+        clone_path = self._cloned_repos.get(repo_info.full_name)
+        if clone_path is not None:
+            try:
+                return self._fetch_from_local(clone_path, repo_info, file_info)
+            except Exception as e:
+                logger.error(f"Unexpected error fetching from clone: {e}")
+                return None
+
         # Try to fetch via GitHub API first (faster, no clone needed)
         content = self._fetch_via_api(repo_info, file_info)
         if content:
@@ -98,11 +128,12 @@ class SkillFetcher:
             # Construct raw GitHub URL
             raw_url = f"https://raw.githubusercontent.com/{repo_info.full_name}/{repo_info.default_branch}/{file_info.path}"
 
-            response = requests.get(raw_url, timeout=30)
+            response = self._session.get(raw_url, timeout=30)
             response.raise_for_status()
 
+            # Hash the raw bytes we already have instead of re-encoding the text
             content = response.text
-            file_hash = self._compute_hash(content)
+            file_hash = self._compute_hash(response.content)
 
             logger.debug(f"Fetched via API: {file_info.path} from {repo_info.full_name}")
 
@@ -130,32 +161,66 @@ class SkillFetcher:
         Returns:
             SkillContent if successful, None otherwise
         """
-        temp_dir = self._get_temp_dir()
-        repo_name = repo_info.full_name.replace("/", "_")
-        clone_path = temp_dir / repo_name
-
         try:
-            # Clone repository if not already cloned
-            if not clone_path.exists():
-                logger.debug(f"Cloning {repo_info.full_name} to {clone_path}")
-                GitRepo.clone_from(
-                    repo_info.clone_url,
-                    clone_path,
-                    depth=1,  # Shallow clone for speed
-                    single_branch=True,
-                    branch=repo_info.default_branch,
-                )
+            with self._clone_lock:
+                temp_dir = self._get_temp_dir()
+                repo_name = repo_info.full_name.replace("/", "_")
+                clone_path = temp_dir / repo_name
+
+                # Clone repository if not already cloned
+                if not clone_path.exists():
+                    logger.debug(f"Cloning {repo_info.full_name} to {clone_path}")
+                    # Partial clone: fetch commits and trees only, no checkout.
+                    # Blobs are downloaded lazily for the files we read.
+                    GitRepo.clone_from(
+                        repo_info.clone_url,
+                        clone_path,
+                        depth=1,  # Shallow clone for speed
+                        single_branch=True,
+                        branch=repo_info.default_branch,
+                        no_checkout=True,
+                        multi_options=["--filter=blob:none"],
+                    )
+                self._cloned_repos[repo_info.full_name] = clone_path
+
+            return self._fetch_from_local(clone_path, repo_info, file_info)
 
-            # Read the file
-            file_path = clone_path / file_info.path
-            if not file_path.exists():
-                logger.warning(f"File not found in cloned repo: {file_info.path}")
-                return None
+        except GitCommandError as e:
+            logger.error(f"Git error cloning {repo_info.full_name}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error fetching via clone: {e}")
+            return None
+
+    def _fetch_from_local(
+        self,
+        clone_path: Path,
+        repo_info: RepoInfo,
+        file_info: FileInfo,
+    ) -> Optional[SkillContent]:
+        """Read a skill file from an already cloned repository.
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+        Args:
+            clone_path: Local path of the cloned repository
+            repo_info: Repository information
+            file_info: File information
+
+        Returns:
+            SkillContent if successful, None otherwise
+        """
+        try:
+            with GitRepo(clone_path) as repo:
+                try:
+                    blob = repo.head.commit.tree / file_info.path
+                except KeyError:
+                    logger.warning(f"File not found in cloned repo: {file_info.path}")
+                    return None
 
-            file_hash = self._compute_hash(content)
+                # Reading the blob fetches it on demand from the partial clone
+                data = blob.data_stream.read()
+
+            file_hash = self._compute_hash(data)
+            content = data.decode("utf-8")
 
             logger.debug(f"Fetched via clone: {file_info.path} from {repo_info.full_name}")
 
@@ -169,27 +234,23 @@ class SkillFetcher:
                 updated_at=file_info.updated_at,
             )
 
-        except GitCommandError as e:
-            logger.error(f"Git error cloning {repo_info.full_name}: {e}")
-            return None
-        except IOError as e:
-            logger.error(f"IO error reading file {file_info.path}: {e}")
+        except GitError as e:
+            logger.error(f"Git error reading {file_info.path} from {repo_info.full_name}: {e}")
             return None
-        except Exception as e:
-            logger.error(f"Unexpected error fetching via clone: {e}")
+        except UnicodeDecodeError as e:
+            logger.error(f"Could not decode {file_info.path} as UTF-8: {e}")
             return None
 
-    def _compute_hash(self, content: str) -> str:
+    def _compute_hash(self, data: bytes) -> str:
         """Compute hash of content for duplicate detection.
 
         Args:
-            content: File content
+            data: Raw file bytes (UTF-8 encoded)
 
         Returns:
             SHA256 hash as hex string
         """
-        import hashlib
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return hashlib.sha256(data, usedforsecurity=False).hexdigest()
 
     def fetch_multiple_skills(
         self,
@@ -205,12 +266,17 @@ class SkillFetcher:
         Returns:
             List of SkillContent objects
         """
-        results: list[SkillContent] = []
-
-        for file_info in file_infos:
-            skill_content = self.fetch_skill_file(repo_info, file_info)
-            if skill_content:
-                results.append(skill_content)
+        # Fetches are network-bound, so run them concurrently; map() keeps input order
+        max_workers = max(1, min(self.config.get("fetch.concurrency", 16), len(file_infos)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = [
+                skill_content
+                for skill_content in executor.map(
+                    lambda file_info: self.fetch_skill_file(repo_info, file_info),
+                    file_infos,
+                )
+                if skill_content
+            ]
 
         logger.info(f"Fetched {len(results)} skills from {repo_info.full_name}")
         return results
@@ -218,3 +284,6 @@ class SkillFetcher:
     def __del__(self):
         """Cleanup on destruction."""
         self.cleanup_temp_clone()
+        session = getattr(self, "_session", None)
+        if session is not None:
+            session.close()
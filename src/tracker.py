@@ -1,20 +1,56 @@
-"""Tracking module for managing processed skills using SQLite + JSON."""
+"""Tracking module for managing processed skills using SQLite."""
 
+import atexit
 import json
 import logging
 import sqlite3
-from dataclasses import dataclass, asdict
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from .config import Config
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+    _JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    IJSON_AVAILABLE = False
+    _JSON_ERRORS = (json.JSONDecodeError,)
+
 
 logger = logging.getLogger(__name__)
 
+# Default minimum seconds between database backups triggered by writes
+_BACKUP_INTERVAL = 30.0
+
+# Default seconds a connection waits for another process's lock before
+# failing with "database is locked"
+_BUSY_TIMEOUT = 30.0
+
+# Rows per executemany call when migrating from JSON
+_MIGRATION_BATCH = 500
+
+# Trailing columns of _SQL_INSERT_SKILL that legacy JSON records lack
+_MIGRATION_NULLS = (None,) * 8
+
+# Rows per fetch when streaming query results
+_FETCH_BATCH = 500
 
-@dataclass
+
+@dataclass(slots=True)
 class SkillInfo:
     """Information about a processed skill."""
 
@@ -37,7 +73,7 @@ class SkillInfo:
     last_health_check: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IssueInfo:
     """Information about a GitHub Issue."""
 
@@ -58,7 +94,7 @@ class IssueInfo:
     local_created_at: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdatePlanInfo:
     """Information about an update plan."""
 
@@ -72,7 +108,7 @@ class UpdatePlanInfo:
     execution_result: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PRInfo:
     """Information about a Pull Request."""
 
@@ -92,7 +128,7 @@ class PRInfo:
     local_created_at: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthCheckResult:
     """Result of a health check."""
 
@@ -105,7 +141,7 @@ class HealthCheckResult:
     created_at: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WebhookEvent:
     """Information about a webhook event."""
 
@@ -121,6 +157,492 @@ class WebhookEvent:
     created_at: Optional[str] = None
 
 
+# Secondary indexes on processed_skills, by name. All of them are used:
+# idx_source_repo_processed by get_processed_by_repo, get_hashes_by_repo and
+# as a covering index for the per-repo counts in get_stats, idx_category
+# covering the per-category counts, and idx_source_path_hash by update
+# detection and the by-path lookups.
+_SKILL_INDEXES = {
+    # Serves get_processed_by_repo()'s ORDER BY from the index; the table is
+    # WITHOUT ROWID, so entries also carry file_hash for hash-only reads
+    "idx_source_repo_processed": (
+        "CREATE INDEX IF NOT EXISTS idx_source_repo_processed "
+        "ON processed_skills(source_repo, processed_at DESC)"
+    ),
+    "idx_category": "CREATE INDEX IF NOT EXISTS idx_category ON processed_skills(category, subcategory)",
+    # Covers "which hash does this path have" lookups without a table seek
+    "idx_source_path_hash": (
+        "CREATE INDEX IF NOT EXISTS idx_source_path_hash ON processed_skills(source_path, file_hash)"
+    ),
+}
+
+# Status indexes on the tracking tables. The issue, PR, plan and skill
+# health indexes are keyed on the column their pending/unhealthy query
+# filters by, followed by the column it orders by, so those queries don't
+# sort. The webhook index instead bounds the failed-event branch on
+# retry_count; get_pending_events() ORs two status ranges, so its
+# ORDER BY created_at still sorts the (small) merged result.
+_STATUS_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_issues_status_created ON issues(processing_status, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_prs_status_created ON pull_requests(processing_status, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_plans_status_created ON update_plans(execution_status, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_skills_health ON processed_skills(health_status, last_health_check)",
+    "CREATE INDEX IF NOT EXISTS idx_events_status_retry ON webhook_events(processing_status, retry_count)",
+)
+
+# Serves get_latest_health_check()'s ORDER BY checked_at DESC LIMIT 1
+_SQL_CREATE_HEALTH_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_health_skill_checked ON health_checks(skill_id, checked_at)"
+)
+
+# WAL lets readers run alongside the writer and, with synchronous=NORMAL,
+# avoids an fsync on every commit
+_SQL_WRITER_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+"""
+
+# Per-connection cache settings, shared by the writer and the reader
+_SQL_CACHE_PRAGMAS = """
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+    PRAGMA mmap_size=268435456;
+"""
+
+# Initial (version 0) processed_skills schema; _run_migrations() brings it
+# up to date
+_SQL_CREATE_SKILLS = """
+    CREATE TABLE IF NOT EXISTS processed_skills (
+        file_hash TEXT PRIMARY KEY,
+        source_repo TEXT NOT NULL,
+        source_path TEXT NOT NULL,
+        source_url TEXT NOT NULL,
+        skill_name TEXT,
+        category TEXT,
+        subcategory TEXT,
+        processed_at TEXT NOT NULL,
+        local_path TEXT,
+        source_created_at TEXT,
+        source_updated_at TEXT,
+        repo_stars INTEGER,
+        repo_forks INTEGER,
+        repo_last_synced TEXT,
+        repo_description TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+# Full processed_skills column set, in the order used by the table rebuild
+_SKILL_TABLE_COLUMNS = """
+    file_hash, source_repo, source_path, source_url, skill_name, category,
+    subcategory, processed_at, local_path, source_created_at, source_updated_at,
+    repo_stars, repo_forks, repo_last_synced, repo_description, created_at,
+    health_status, last_health_check
+"""
+
+_SQL_CREATE_SKILLS_WITHOUT_ROWID = """
+    CREATE TABLE processed_skills_new (
+        file_hash TEXT PRIMARY KEY,
+        source_repo TEXT NOT NULL,
+        source_path TEXT NOT NULL,
+        source_url TEXT NOT NULL,
+        skill_name TEXT,
+        category TEXT,
+        subcategory TEXT,
+        processed_at TEXT NOT NULL,
+        local_path TEXT,
+        source_created_at TEXT,
+        source_updated_at TEXT,
+        repo_stars INTEGER,
+        repo_forks INTEGER,
+        repo_last_synced TEXT,
+        repo_description TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        health_status TEXT DEFAULT 'unknown',
+        last_health_check TEXT
+    ) WITHOUT ROWID
+"""
+
+# Upsert rather than INSERT OR REPLACE: an existing row is updated in place
+# instead of being deleted and re-inserted
+_SQL_INSERT_SKILL = """
+    INSERT INTO processed_skills
+    (file_hash, source_repo, source_path, source_url, skill_name, category, subcategory, processed_at, local_path, source_created_at, source_updated_at, repo_stars, repo_forks, repo_last_synced, repo_description, health_status, last_health_check)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(file_hash) DO UPDATE SET
+        source_repo = excluded.source_repo,
+        source_path = excluded.source_path,
+        source_url = excluded.source_url,
+        skill_name = excluded.skill_name,
+        category = excluded.category,
+        subcategory = excluded.subcategory,
+        processed_at = excluded.processed_at,
+        local_path = excluded.local_path,
+        source_created_at = excluded.source_created_at,
+        source_updated_at = excluded.source_updated_at,
+        repo_stars = excluded.repo_stars,
+        repo_forks = excluded.repo_forks,
+        repo_last_synced = excluded.repo_last_synced,
+        repo_description = excluded.repo_description,
+        health_status = excluded.health_status,
+        last_health_check = excluded.last_health_check
+"""
+
+
+# Queries on processed_skills, kept as module constants so each text is
+# compiled once per connection and then served from the statement cache
+_SKILL_COLUMNS = """
+    file_hash, source_repo, source_path, source_url,
+    COALESCE(skill_name, ''), COALESCE(category, ''),
+    COALESCE(subcategory, ''), processed_at, local_path,
+    source_created_at, source_updated_at, repo_stars, repo_forks,
+    repo_last_synced, repo_description, health_status, last_health_check
+"""
+
+_SQL_GET_ALL = f"""
+    SELECT {_SKILL_COLUMNS}
+    FROM processed_skills
+    ORDER BY processed_at DESC
+"""
+
+_SQL_GET_BY_REPO = f"""
+    SELECT {_SKILL_COLUMNS}
+    FROM processed_skills
+    WHERE source_repo = ?
+    ORDER BY processed_at DESC
+"""
+
+_SQL_HASHES_BY_REPO = "SELECT file_hash FROM processed_skills WHERE source_repo = ?"
+
+_SQL_GET_BY_SOURCE_PATH = f"""
+    SELECT {_SKILL_COLUMNS}
+    FROM processed_skills
+    WHERE source_path = ?
+    LIMIT 1
+"""
+
+_SQL_GET_BY_HEALTH = f"""
+    SELECT {_SKILL_COLUMNS}
+    FROM processed_skills
+    WHERE health_status = ?
+    ORDER BY last_health_check DESC
+"""
+
+_SQL_COUNT = "SELECT COUNT(*) FROM processed_skills"
+
+_SQL_ALL_HASHES = "SELECT file_hash FROM processed_skills"
+
+_SQL_EXISTS = "SELECT 1 FROM processed_skills WHERE file_hash = ?"
+
+_SQL_DELETE = "DELETE FROM processed_skills WHERE file_hash = ?"
+
+_SQL_UPDATE_HASH = """
+    UPDATE processed_skills
+    SET file_hash = ?,
+        skill_name = ?,
+        processed_at = ?,
+        source_created_at = ?,
+        source_updated_at = ?,
+        repo_stars = ?,
+        repo_forks = ?,
+        repo_last_synced = ?,
+        repo_description = ?,
+        health_status = ?,
+        last_health_check = ?
+    WHERE source_path = ?
+"""
+
+_SQL_HASH_BY_SOURCE_PATH = "SELECT file_hash FROM processed_skills WHERE source_path = ? LIMIT 1"
+
+_SQL_HASHES_BY_SOURCE_PATH = "SELECT file_hash FROM processed_skills WHERE source_path = ?"
+
+_SQL_HASH_CHANGED = """
+    SELECT 1 FROM processed_skills
+    WHERE source_path = ? AND file_hash != ?
+    LIMIT 1
+"""
+
+_SQL_STATS = """
+    SELECT 'category', * FROM (
+        SELECT category, COUNT(*)
+        FROM processed_skills
+        GROUP BY category
+        ORDER BY COUNT(*) DESC
+    )
+    UNION ALL
+    SELECT 'repo', * FROM (
+        SELECT source_repo, COUNT(*)
+        FROM processed_skills
+        GROUP BY source_repo
+        ORDER BY COUNT(*) DESC
+        LIMIT 10
+    )
+"""
+
+
+def _skill_row(skill_info: SkillInfo) -> tuple:
+    """Build the parameter tuple for _SQL_INSERT_SKILL.
+
+    Args:
+        skill_info: Skill information to insert
+
+    Returns:
+        Column values in insert order
+    """
+    return (
+        skill_info.file_hash,
+        skill_info.source_repo,
+        skill_info.source_path,
+        skill_info.source_url,
+        skill_info.skill_name,
+        skill_info.category,
+        skill_info.subcategory,
+        skill_info.processed_at,
+        skill_info.local_path,
+        skill_info.source_created_at,
+        skill_info.source_updated_at,
+        skill_info.repo_stars,
+        skill_info.repo_forks,
+        skill_info.repo_last_synced,
+        skill_info.repo_description,
+        skill_info.health_status,
+        skill_info.last_health_check,
+    )
+
+
+# INSERT OR REPLACE: re-adding an issue or PR overwrites the stored row
+_SQL_INSERT_ISSUE = """
+    INSERT OR REPLACE INTO issues
+    (issue_number, issue_title, issue_body, issue_state, issue_author,
+     created_at, updated_at, processed_at, processing_status, labels,
+     analysis_result, filter_reason, update_plan, error_message, local_created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_PR = """
+    INSERT OR REPLACE INTO pull_requests
+    (pr_number, pr_title, pr_author, pr_state, head_ref, base_ref,
+     created_at, updated_at, processed_at, processing_status,
+     validation_results, skill_files_added, error_message, local_created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+# Current UTC time as an ISO 8601 string (millisecond precision), for
+# timestamps SQLite can fill in without a value bound from Python
+_SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%f', 'now')"
+
+# Queries on the issue, PR, plan, health check and webhook tables
+_ISSUE_COLUMNS = """
+    issue_number, issue_title, issue_body, issue_state, issue_author,
+    created_at, updated_at, processed_at, processing_status, labels,
+    analysis_result, filter_reason, update_plan, error_message, local_created_at
+"""
+
+_SQL_GET_ISSUE = f"SELECT {_ISSUE_COLUMNS} FROM issues WHERE issue_number = ?"
+
+_SQL_GET_ISSUES_BY_STATUS = f"""
+    SELECT {_ISSUE_COLUMNS}
+    FROM issues WHERE processing_status = ?
+    ORDER BY created_at ASC
+    LIMIT ?
+"""
+
+_PR_COLUMNS = """
+    pr_number, pr_title, pr_author, pr_state, head_ref, base_ref,
+    created_at, updated_at, processed_at, processing_status,
+    validation_results, skill_files_added, error_message, local_created_at
+"""
+
+_SQL_GET_PR = f"SELECT {_PR_COLUMNS} FROM pull_requests WHERE pr_number = ?"
+
+_SQL_GET_PRS_BY_STATUS = f"""
+    SELECT {_PR_COLUMNS}
+    FROM pull_requests WHERE processing_status = ?
+    ORDER BY created_at ASC
+    LIMIT ?
+"""
+
+_SQL_INSERT_PLAN = """
+    INSERT INTO update_plans
+    (plan_type, source_issue, plan_data, execution_status, created_at, executed_at, execution_result)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_GET_PENDING_PLANS = """
+    SELECT plan_id, plan_type, source_issue, plan_data, execution_status, created_at, executed_at, execution_result
+    FROM update_plans WHERE execution_status = 'pending'
+    ORDER BY created_at ASC
+"""
+
+# A NULL execution_result leaves the stored one unchanged
+_SQL_UPDATE_PLAN = f"""
+    UPDATE update_plans
+    SET execution_status = ?, executed_at = {_SQL_NOW}, execution_result = COALESCE(?, execution_result)
+    WHERE plan_id = ?
+"""
+
+_SQL_INSERT_HEALTH_CHECK = """
+    INSERT INTO health_checks
+    (check_type, skill_id, check_result, check_details, checked_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_HEALTH_CHECK_COLUMNS = "check_id, check_type, skill_id, check_result, check_details, checked_at, created_at"
+
+# A NULL check type matches any type. idx_health_skill_checked walks the
+# skill's checks newest first either way, so neither case sorts.
+_SQL_LATEST_HEALTH_CHECK = f"""
+    SELECT {_HEALTH_CHECK_COLUMNS}
+    FROM health_checks
+    WHERE skill_id = ? AND (? IS NULL OR check_type = ?)
+    ORDER BY checked_at DESC LIMIT 1
+"""
+
+_SQL_UPDATE_SKILL_HEALTH = """
+    UPDATE processed_skills
+    SET health_status = ?, last_health_check = ?
+    WHERE file_hash = ?
+"""
+
+_SQL_INSERT_EVENT = f"""
+    INSERT INTO webhook_events
+    (event_type, repo_name, event_payload, received_at)
+    VALUES (?, ?, ?, COALESCE(?, {_SQL_NOW}))
+"""
+
+# Events not yet processed, plus failed ones still under the retry limit
+_PENDING_EVENTS_WHERE = """
+    WHERE processing_status = 'pending' OR (processing_status = 'failed' AND retry_count < ?)
+"""
+
+_SQL_GET_PENDING_EVENTS = f"""
+    SELECT event_id, event_type, repo_name, event_payload, received_at,
+           processed_at, processing_status, retry_count, error_message, created_at
+    FROM webhook_events
+    {_PENDING_EVENTS_WHERE}
+    ORDER BY created_at ASC
+"""
+
+_SQL_COUNT_PENDING_EVENTS = f"SELECT COUNT(*) FROM webhook_events {_PENDING_EVENTS_WHERE}"
+
+_SQL_UPDATE_EVENT = f"""
+    UPDATE webhook_events
+    SET processing_status = ?, processed_at = {_SQL_NOW}, error_message = ?, retry_count = retry_count + ?
+    WHERE event_id = ?
+"""
+
+# Optional columns update_issue_status() and update_pr_status() accept as
+# keyword arguments. Each is written only when its flag parameter is true,
+# so one fixed statement covers every combination of arguments.
+_ISSUE_UPDATE_FIELDS = ("processed_at", "analysis_result", "filter_reason", "update_plan", "error_message")
+
+_PR_UPDATE_FIELDS = ("processed_at", "validation_results", "skill_files_added", "error_message")
+
+
+def _status_update_sql(table: str, status_column: str, key_column: str, optional: Tuple[str, ...]) -> str:
+    """Build a fixed-shape status UPDATE with optionally written columns.
+
+    Args:
+        table: Table name
+        status_column: Column always set from the first parameter
+        key_column: Column matched against the last parameter
+        optional: Columns set only when their flag parameter is true
+
+    Returns:
+        UPDATE statement taking the status, a (flag, value) pair per
+        optional column, then the key
+    """
+    assignments = [f"{status_column} = ?"]
+    assignments += [f"{col} = CASE WHEN ? THEN ? ELSE {col} END" for col in optional]
+    return f"UPDATE {table} SET {', '.join(assignments)} WHERE {key_column} = ?"
+
+
+_SQL_UPDATE_ISSUE = _status_update_sql("issues", "processing_status", "issue_number", _ISSUE_UPDATE_FIELDS)
+
+_SQL_UPDATE_PR = _status_update_sql("pull_requests", "processing_status", "pr_number", _PR_UPDATE_FIELDS)
+
+
+def _status_update_params(status: str, key, optional: Tuple[str, ...], kwargs: dict) -> list:
+    """Build the parameters for a _status_update_sql() statement.
+
+    Args:
+        status: New status
+        key: Primary key of the row to update
+        optional: Optional columns, in statement order
+        kwargs: Values for the columns to write; absent ones are left as is
+
+    Returns:
+        Parameter list
+    """
+    values = [status]
+    for col in optional:
+        values += (col in kwargs, kwargs.get(col))
+    values.append(key)
+    return values
+
+
+def _issue_row(issue_info: IssueInfo, default_ts: str) -> tuple:
+    """Build the parameter tuple for _SQL_INSERT_ISSUE.
+
+    Args:
+        issue_info: Issue information to insert
+        default_ts: local_created_at to use when the issue has none
+
+    Returns:
+        Column values in insert order
+    """
+    return (
+        issue_info.issue_number,
+        issue_info.issue_title,
+        issue_info.issue_body,
+        issue_info.issue_state,
+        issue_info.issue_author,
+        issue_info.created_at,
+        issue_info.updated_at,
+        issue_info.processed_at,
+        issue_info.processing_status,
+        issue_info.labels,
+        issue_info.analysis_result,
+        issue_info.filter_reason,
+        issue_info.update_plan,
+        issue_info.error_message,
+        issue_info.local_created_at or default_ts,
+    )
+
+
+def _pr_row(pr_info: PRInfo, default_ts: str) -> tuple:
+    """Build the parameter tuple for _SQL_INSERT_PR.
+
+    Args:
+        pr_info: PR information to insert
+        default_ts: local_created_at to use when the PR has none
+
+    Returns:
+        Column values in insert order
+    """
+    return (
+        pr_info.pr_number,
+        pr_info.pr_title,
+        pr_info.pr_author,
+        pr_info.pr_state,
+        pr_info.head_ref,
+        pr_info.base_ref,
+        pr_info.created_at,
+        pr_info.updated_at,
+        pr_info.processed_at,
+        pr_info.processing_status,
+        pr_info.validation_results,
+        pr_info.skill_files_added,
+        pr_info.error_message,
+        pr_info.local_created_at or default_ts,
+    )
+
+
+# SkillInfo field names, in declaration (and column) order
+_SKILL_FIELDS = tuple(f.name for f in fields(SkillInfo))
+
+
 class Tracker:
     """Track processed skills to prevent duplicates."""
 
@@ -137,12 +659,42 @@ class Tracker:
         # SQLite database path
         self.db_path = self.data_dir / "skills_tracker.db"
 
-        # JSON backup path
+        # Database snapshot, refreshed after writes
+        self.backup_path = self.data_dir / "skills_tracker.db.bak"
+
+        # Legacy JSON store, imported once into an empty database
         self.json_path = self.data_dir / "skills_tracker.json"
 
-        # Database version tracking
+        # Legacy schema version file, superseded by PRAGMA user_version
         self.db_version_path = self.data_dir / ".db_version"
 
+        # One long-lived connection shared by all methods (autocommit mode).
+        # The lock is re-entrant because some methods call others while holding it.
+        # The statement cache is sized so every query here stays compiled for
+        # the connection's lifetime. Other processes (webhook server, CLI runs)
+        # may hold the write lock briefly, so waits are bounded by busy_timeout.
+        self._busy_timeout = config.get("tracker.busy_timeout", _BUSY_TIMEOUT)
+        self._conn = sqlite3.connect(
+            self.db_path,
+            timeout=self._busy_timeout,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
+        self._lock = threading.RLock()
+
+        # Hashes known to be in processed_skills, loaded on first lookup
+        self._seen_hashes: Optional[Set[str]] = None
+
+        # The backup is refreshed at most every backup_interval seconds, on a
+        # background thread; _dirty records writes not yet reflected in it
+        self._backup_enabled = config.get("tracker.backup_enabled", True)
+        self._backup_interval = config.get("tracker.backup_interval", _BACKUP_INTERVAL)
+        self._dirty = False
+        self._last_backup_ts = 0.0
+        self._backup_thread: Optional[threading.Thread] = None
+        atexit.register(_flush_on_exit, weakref.ref(self))
+
         # Initialize database
         self._init_database()
 
@@ -152,52 +704,42 @@ class Tracker:
         # Load existing JSON data if database is empty
         self._migrate_from_json()
 
+        # Read-only connection for SELECT-only methods. Under WAL it reads
+        # the last committed state without waiting on the writer's lock.
+        self._ro_uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+        self._rconn = sqlite3.connect(
+            self._ro_uri,
+            uri=True,
+            timeout=self._busy_timeout,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        self._rconn.executescript(_SQL_CACHE_PRAGMAS)
+        self._rlock = threading.Lock()
+
     def _init_database(self) -> None:
         """Initialize SQLite database with required tables."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS processed_skills (
-                    file_hash TEXT PRIMARY KEY,
-                    source_repo TEXT NOT NULL,
-                    source_path TEXT NOT NULL,
-                    source_url TEXT NOT NULL,
-                    skill_name TEXT,
-                    category TEXT,
-                    subcategory TEXT,
-                    processed_at TEXT NOT NULL,
-                    local_path TEXT,
-                    source_created_at TEXT,
-                    source_updated_at TEXT,
-                    repo_stars INTEGER,
-                    repo_forks INTEGER,
-                    repo_last_synced TEXT,
-                    repo_description TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            cursor = self._conn.cursor()
+
+            cursor.executescript(_SQL_WRITER_PRAGMAS + _SQL_CACHE_PRAGMAS)
+
+            # Re-opens skip the DDL entirely; once the table exists, schema
+            # changes are left to _run_migrations()
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'processed_skills'"
+            )
+            if cursor.fetchone() is None:
+                # A version file left from a deleted database doesn't apply
+                self.db_version_path.unlink(missing_ok=True)
+
+                # Table and indexes in one script and one transaction
+                cursor.executescript(
+                    "BEGIN;"
+                    + _SQL_CREATE_SKILLS + ";"
+                    + ";".join(_SKILL_INDEXES.values()) + ";"
+                    + "COMMIT;"
                 )
-            """)
-
-            # Create index for faster lookups
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_source_repo
-                ON processed_skills(source_repo)
-            """)
-
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_category
-                ON processed_skills(category, subcategory)
-            """)
-
-            # Create index for source_path lookups (for updates)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_source_path
-                ON processed_skills(source_path)
-            """)
-
-            conn.commit()
-            conn.close()
 
             logger.debug(f"Initialized tracker database at {self.db_path}")
 
@@ -208,15 +750,22 @@ class Tracker:
     def _get_db_version(self) -> int:
         """Get the current database version.
 
+        The version lives in the database header (PRAGMA user_version), so it
+        travels with the file. A legacy .db_version sidecar is adopted once
+        and removed.
+
         Returns:
             Current database version (0 if not tracked)
         """
-        if self.db_version_path.exists():
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version == 0 and self.db_version_path.exists():
             try:
-                return int(self.db_version_path.read_text().strip())
+                version = int(self.db_version_path.read_text().strip())
             except (IOError, ValueError):
-                pass
-        return 0
+                return 0
+            self._set_db_version(version)
+            self.db_version_path.unlink(missing_ok=True)
+        return version
 
     def _set_db_version(self, version: int) -> None:
         """Set the database version.
@@ -224,12 +773,13 @@ class Tracker:
         Args:
             version: Version number to write
         """
-        self.db_version_path.write_text(str(version))
+        # PRAGMA arguments can't be bound as parameters
+        self._conn.execute(f"PRAGMA user_version = {int(version)}")
 
     def _run_migrations(self) -> None:
         """Run database migrations if needed."""
         current_version = self._get_db_version()
-        target_version = 4  # Current schema version
+        target_version = 9  # Current schema version
 
         if current_version >= target_version:
             return
@@ -237,63 +787,47 @@ class Tracker:
         logger.info(f"Migrating database from version {current_version} to {target_version}")
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # Migration 1: Add source_created_at and source_updated_at columns
-            if current_version < 1:
-                try:
-                    cursor.execute("""
-                        ALTER TABLE processed_skills
-                        ADD COLUMN source_created_at TEXT
-                    """)
-                    cursor.execute("""
-                        ALTER TABLE processed_skills
-                        ADD COLUMN source_updated_at TEXT
-                    """)
-                    logger.info("Added source_created_at and source_updated_at columns")
-                except sqlite3.OperationalError as e:
-                    if "duplicate column" not in str(e).lower():
-                        raise
-
-            # Migration 2: Add index for source_path
-            if current_version < 2:
-                try:
-                    cursor.execute("""
-                        CREATE INDEX IF NOT EXISTS idx_source_path
-                        ON processed_skills(source_path)
-                    """)
-                    logger.info("Added index for source_path")
-                except sqlite3.OperationalError:
-                    pass
-
-            # Migration 3: Add repo metadata columns
-            if current_version < 3:
-                try:
-                    cursor.execute("""
-                        ALTER TABLE processed_skills
-                        ADD COLUMN repo_stars INTEGER
-                    """)
-                    cursor.execute("""
-                        ALTER TABLE processed_skills
-                        ADD COLUMN repo_forks INTEGER
-                    """)
-                    cursor.execute("""
-                        ALTER TABLE processed_skills
-                        ADD COLUMN repo_last_synced TEXT
-                    """)
-                    cursor.execute("""
-                        ALTER TABLE processed_skills
-                        ADD COLUMN repo_description TEXT
-                    """)
-                    logger.info("Added repo_stars, repo_forks, repo_last_synced, repo_description columns")
-                except sqlite3.OperationalError as e:
-                    if "duplicate column" not in str(e).lower():
-                        raise
-
-            # Migration 4: Add Issues, PRs, Health Checks, and Webhooks tables
-            if current_version < 4:
-                try:
+            # All steps commit together with the new version, so a failure
+            # leaves the schema at the old version instead of partially migrated
+            with self._transaction():
+                # Another process may have migrated before we took the write lock
+                current_version = self._get_db_version()
+                if current_version >= target_version:
+                    return
+
+                cursor = self._conn.cursor()
+
+                # Migration 1: Add source_created_at and source_updated_at columns
+                if current_version < 1:
+                    if self._add_missing_columns(cursor, "processed_skills", {
+                        "source_created_at": "TEXT",
+                        "source_updated_at": "TEXT",
+                    }):
+                        logger.info("Added source_created_at and source_updated_at columns")
+
+                # Migration 2: Add index for source_path
+                if current_version < 2:
+                    try:
+                        cursor.execute("""
+                            CREATE INDEX IF NOT EXISTS idx_source_path
+                            ON processed_skills(source_path)
+                        """)
+                        logger.info("Added index for source_path")
+                    except sqlite3.OperationalError:
+                        pass
+
+                # Migration 3: Add repo metadata columns
+                if current_version < 3:
+                    if self._add_missing_columns(cursor, "processed_skills", {
+                        "repo_stars": "INTEGER",
+                        "repo_forks": "INTEGER",
+                        "repo_last_synced": "TEXT",
+                        "repo_description": "TEXT",
+                    }):
+                        logger.info("Added repo_stars, repo_forks, repo_last_synced, repo_description columns")
+
+                # Migration 4: Add Issues, PRs, Health Checks, and Webhooks tables
+                if current_version < 4:
                     # Create issues table
                     cursor.execute("""
                         CREATE TABLE IF NOT EXISTS issues (
@@ -380,14 +914,10 @@ class Tracker:
                     """)
 
                     # Add health status columns to processed_skills
-                    cursor.execute("""
-                        ALTER TABLE processed_skills
-                        ADD COLUMN health_status TEXT DEFAULT 'unknown'
-                    """)
-                    cursor.execute("""
-                        ALTER TABLE processed_skills
-                        ADD COLUMN last_health_check TEXT
-                    """)
+                    health_columns_added = self._add_missing_columns(cursor, "processed_skills", {
+                        "health_status": "TEXT DEFAULT 'unknown'",
+                        "last_health_check": "TEXT",
+                    })
 
                     # Create indexes for new tables
                     cursor.execute("""
@@ -412,31 +942,94 @@ class Tracker:
                     """)
 
                     logger.info("Added issues, update_plans, pull_requests, health_checks, webhook_events tables")
-                    logger.info("Added health_status and last_health_check columns to processed_skills")
-                except sqlite3.OperationalError as e:
-                    if "duplicate column" not in str(e).lower():
-                        raise
-
-            conn.commit()
-            conn.close()
+                    if health_columns_added:
+                        logger.info("Added health_status and last_health_check columns to processed_skills")
+
+                # Migration 5: Replace the source_path index with a covering one
+                if current_version < 5:
+                    cursor.execute("DROP INDEX IF EXISTS idx_source_path")
+                    cursor.execute(_SKILL_INDEXES["idx_source_path_hash"])
+                    logger.info("Replaced source_path index with covering (source_path, file_hash) index")
+
+                # Migration 6: Rebuild processed_skills as a WITHOUT ROWID table
+                # clustered on file_hash, so hash lookups need one B-tree
+                # instead of the primary key index plus the rowid table
+                if current_version < 6:
+                    cursor.execute(
+                        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'processed_skills'"
+                    )
+                    if "WITHOUT ROWID" not in cursor.fetchone()[0].upper():
+                        cursor.execute(_SQL_CREATE_SKILLS_WITHOUT_ROWID)
+                        # A rowid table tolerates NULL in a TEXT primary key; such
+                        # rows can't be looked up by hash and aren't carried over
+                        cursor.execute(f"""
+                            INSERT INTO processed_skills_new ({_SKILL_TABLE_COLUMNS})
+                            SELECT {_SKILL_TABLE_COLUMNS} FROM processed_skills
+                            WHERE file_hash IS NOT NULL
+                        """)
+                        cursor.execute("DROP TABLE processed_skills")
+                        cursor.execute("ALTER TABLE processed_skills_new RENAME TO processed_skills")
+                        for index_sql in _SKILL_INDEXES.values():
+                            cursor.execute(index_sql)
+                        logger.info("Rebuilt processed_skills as a WITHOUT ROWID table")
+
+                # Migration 7: Order the source_repo index by processed_at
+                if current_version < 7:
+                    cursor.execute("DROP INDEX IF EXISTS idx_source_repo")
+                    cursor.execute(_SKILL_INDEXES["idx_source_repo_processed"])
+                    logger.info("Replaced source_repo index with (source_repo, processed_at) index")
+
+                # Migration 8: Composite status indexes (see _STATUS_INDEXES);
+                # all but the webhook one also serve their query's ORDER BY
+                if current_version < 8:
+                    for old_index in ("idx_issues_status", "idx_prs_status",
+                                      "idx_plans_status", "idx_webhook_events_status"):
+                        cursor.execute(f"DROP INDEX IF EXISTS {old_index}")
+                    for index_sql in _STATUS_INDEXES:
+                        cursor.execute(index_sql)
+                    logger.info("Replaced status indexes with composite status indexes")
+
+                # Migration 9: Order the health check index by checked_at
+                if current_version < 9:
+                    cursor.execute("DROP INDEX IF EXISTS idx_health_checks_skill")
+                    cursor.execute(_SQL_CREATE_HEALTH_INDEX)
+                    logger.info("Replaced health_checks skill index with (skill_id, checked_at) index")
+
+                # Update version
+                self._set_db_version(target_version)
 
-            # Update version
-            self._set_db_version(target_version)
             logger.info(f"Database migration complete (version {target_version})")
 
         except sqlite3.Error as e:
             logger.error(f"Database migration error: {e}")
             raise
 
+    def _add_missing_columns(self, cursor: sqlite3.Cursor, table: str, columns: Dict[str, str]) -> List[str]:
+        """Add the columns a table doesn't have yet.
+
+        Diffing against PRAGMA table_info makes each step safe to re-run on
+        a partially migrated database without relying on ALTER errors.
+
+        Args:
+            cursor: Cursor inside the migration transaction
+            table: Table name
+            columns: Column name to type/constraint spec
+
+        Returns:
+            Names of the columns that were added
+        """
+        existing = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+        added = []
+        for name, spec in columns.items():
+            if name not in existing:
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {name} {spec}")
+                added.append(name)
+        return added
+
     def _migrate_from_json(self) -> None:
         """Migrate data from JSON file if database is empty."""
         # Check if database has any records
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT COUNT(*) FROM processed_skills")
-        count = cursor.fetchone()[0]
-        conn.close()
+        count = self._conn.execute(_SQL_COUNT).fetchone()[0]
 
         if count > 0:
             return  # Database already has data
@@ -446,76 +1039,110 @@ class Tracker:
             return
 
         try:
-            with open(self.json_path, "r") as f:
-                data = json.load(f)
+            with open(self.json_path, "rb") as f:
+                # Stream records one at a time rather than loading the whole file
+                if IJSON_AVAILABLE:
+                    if not _is_json_array(f):
+                        return
+                    data = ijson.items(f, "item", use_float=True)
+                else:
+                    data = json.load(f)
+                    if not isinstance(data, list):
+                        return
+
+                # One timestamp for every record missing processed_at
+                default_ts = datetime.utcnow().isoformat()
+                # Build insert tuples straight from the dicts; the legacy JSON
+                # only carries the first nine columns, the rest stay NULL
+                rows = (
+                    (
+                        item.get("file_hash", ""),
+                        item.get("source_repo", ""),
+                        item.get("source_path", ""),
+                        item.get("source_url", ""),
+                        item.get("skill_name", ""),
+                        item.get("category", ""),
+                        item.get("subcategory", ""),
+                        item.get("processed_at", default_ts),
+                        item.get("local_path"),
+                    ) + _MIGRATION_NULLS
+                    for item in data
+                    if isinstance(item, dict)
+                )
 
-            if not isinstance(data, list):
-                return
-
-            logger.info(f"Migrating {len(data)} records from JSON to database")
-
-            for item in data:
-                if isinstance(item, dict):
-                    skill_info = SkillInfo(
-                        file_hash=item.get("file_hash", ""),
-                        source_repo=item.get("source_repo", ""),
-                        source_path=item.get("source_path", ""),
-                        source_url=item.get("source_url", ""),
-                        skill_name=item.get("skill_name", ""),
-                        category=item.get("category", ""),
-                        subcategory=item.get("subcategory", ""),
-                        processed_at=item.get("processed_at", datetime.utcnow().isoformat()),
-                        local_path=item.get("local_path"),
-                    )
-                    self._insert_to_db(skill_info)
+                # Insert in batches, all in a single transaction instead of one
+                # commit per row. Indexes are dropped for the load and rebuilt
+                # once afterwards rather than updated row by row.
+                migrated = 0
+                with self._transaction():
+                    for index_name in _SKILL_INDEXES:
+                        self._conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+                    while True:
+                        batch = list(islice(rows, _MIGRATION_BATCH))
+                        if not batch:
+                            break
+                        self._conn.executemany(_SQL_INSERT_SKILL, batch)
+                        migrated += len(batch)
+                    for index_sql in _SKILL_INDEXES.values():
+                        self._conn.execute(index_sql)
+
+                # Seed planner statistics for the freshly loaded table
+                self._conn.execute("ANALYZE")
+
+            logger.info(f"Migrated {migrated} records from JSON to database")
 
             # Backup the migrated JSON
             backup_path = self.json_path.with_suffix(".json.bak")
             self.json_path.rename(backup_path)
             logger.info(f"Backed up migrated JSON to {backup_path}")
 
-        except (IOError, json.JSONDecodeError) as e:
+        except (IOError, sqlite3.Error, *_JSON_ERRORS) as e:
             logger.warning(f"Could not migrate from JSON: {e}")
 
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Run the enclosed statements in one transaction, holding the lock.
+
+        The connection is in autocommit mode, so BEGIN/COMMIT are explicit;
+        any exception rolls the transaction back and is re-raised. BEGIN
+        IMMEDIATE takes the write lock up front, so another process holding
+        it makes us wait at the start rather than fail midway through.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Hold the read-only connection for the enclosed queries.
+
+        Yields:
+            The read-only connection
+        """
+        with self._rlock:
+            yield self._rconn
+
     def _insert_to_db(self, skill_info: SkillInfo) -> None:
         """Insert skill info into database.
 
         Args:
             skill_info: Skill information to insert
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
 
-        try:
-            cursor.execute("""
-                INSERT OR REPLACE INTO processed_skills
-                (file_hash, source_repo, source_path, source_url, skill_name, category, subcategory, processed_at, local_path, source_created_at, source_updated_at, repo_stars, repo_forks, repo_last_synced, repo_description, health_status, last_health_check)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                skill_info.file_hash,
-                skill_info.source_repo,
-                skill_info.source_path,
-                skill_info.source_url,
-                skill_info.skill_name,
-                skill_info.category,
-                skill_info.subcategory,
-                skill_info.processed_at,
-                skill_info.local_path,
-                skill_info.source_created_at,
-                skill_info.source_updated_at,
-                skill_info.repo_stars,
-                skill_info.repo_forks,
-                skill_info.repo_last_synced,
-                skill_info.repo_description,
-                skill_info.health_status,
-                skill_info.last_health_check,
-            ))
-
-            conn.commit()
-        except sqlite3.Error as e:
-            logger.error(f"Database insert error: {e}")
-        finally:
-            conn.close()
+            try:
+                cursor.execute(_SQL_INSERT_SKILL, _skill_row(skill_info))
+                if self._seen_hashes is not None:
+                    self._seen_hashes.add(skill_info.file_hash)
+
+            except sqlite3.Error as e:
+                logger.error(f"Database insert error: {e}")
 
     def is_already_processed(self, file_hash: str) -> bool:
         """Check if a skill has already been processed.
@@ -526,18 +1153,23 @@ class Tracker:
         Returns:
             True if already processed, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        try:
-            cursor.execute("SELECT 1 FROM processed_skills WHERE file_hash = ? LIMIT 1", (file_hash,))
-            result = cursor.fetchone()
-            return result is not None
-        except sqlite3.Error as e:
-            logger.error(f"Database query error: {e}")
-            return False
-        finally:
-            conn.close()
+        with self._lock:
+            try:
+                # Answer repeat checks from memory; the set only holds hashes
+                # seen in the table, so misses still consult the database in
+                # case another Tracker instance has inserted them since
+                if self._seen_hashes is None:
+                    self._seen_hashes = {row[0] for row in self._conn.execute(_SQL_ALL_HASHES)}
+                if file_hash in self._seen_hashes:
+                    return True
+
+                result = self._conn.execute(_SQL_EXISTS, (file_hash,)).fetchone()
+                if result is not None:
+                    self._seen_hashes.add(file_hash)
+                return result is not None
+            except sqlite3.Error as e:
+                logger.error(f"Database query error: {e}")
+                return False
 
     def mark_as_processed(self, skill_info: SkillInfo) -> bool:
         """Mark a skill as processed.
@@ -550,59 +1182,97 @@ class Tracker:
         """
         try:
             self._insert_to_db(skill_info)
-            self._save_json_backup()
+            self._backup_if_due()
             logger.debug(f"Marked as processed: {skill_info.source_repo}/{skill_info.source_path}")
             return True
         except Exception as e:
             logger.error(f"Error marking as processed: {e}")
             return False
 
+    def mark_many_as_processed(self, skills: List[SkillInfo]) -> int:
+        """Mark several skills as processed in a single transaction.
+
+        Args:
+            skills: Skill information to record
+
+        Returns:
+            Number of skills recorded (0 on error)
+        """
+        if not skills:
+            return 0
+
+        with self._lock:
+            try:
+                with self._transaction():
+                    self._conn.executemany(_SQL_INSERT_SKILL, [_skill_row(skill) for skill in skills])
+            except sqlite3.Error as e:
+                logger.error(f"Database insert error: {e}")
+                return 0
+
+            if self._seen_hashes is not None:
+                self._seen_hashes.update(skill.file_hash for skill in skills)
+            self._backup_if_due()
+
+        logger.debug(f"Marked {len(skills)} skills as processed")
+        return len(skills)
+
     def get_all_processed(self) -> List[SkillInfo]:
         """Get all processed skills.
 
         Returns:
             List of SkillInfo objects
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            try:
+                return [SkillInfo(*row) for row in conn.execute(_SQL_GET_ALL)]
 
-        try:
-            cursor.execute("""
-                SELECT file_hash, source_repo, source_path, source_url,
-                       skill_name, category, subcategory, processed_at, local_path,
-                       source_created_at, source_updated_at, repo_stars, repo_forks,
-                       repo_last_synced, repo_description, health_status, last_health_check
-                FROM processed_skills
-                ORDER BY processed_at DESC
-            """)
-
-            results = []
-            for row in cursor.fetchall():
-                results.append(SkillInfo(
-                    file_hash=row[0],
-                    source_repo=row[1],
-                    source_path=row[2],
-                    source_url=row[3],
-                    skill_name=row[4] or "",
-                    category=row[5] or "",
-                    subcategory=row[6] or "",
-                    processed_at=row[7],
-                    local_path=row[8],
-                    source_created_at=row[9],
-                    source_updated_at=row[10],
-                    repo_stars=row[11],
-                    repo_forks=row[12],
-                    repo_last_synced=row[13],
-                    repo_description=row[14],
-                    health_status=row[15],
-                    last_health_check=row[16],
-                ))
+            except sqlite3.Error as e:
+                logger.error(f"Database query error: {e}")
+                return []
 
-            return results
+    def iter_all_processed(self) -> Iterator[SkillInfo]:
+        """Iterate over all processed skills without materializing the list.
 
-        except sqlite3.Error as e:
-            logger.error(f"Database query error: {e}")
-            return []
+        Rows are fetched in chunks from a private read-only connection, so
+        a partly consumed iterator doesn't hold back other readers.
+
+        Yields:
+            SkillInfo objects, newest first
+
+        Raises:
+            sqlite3.Error: If the query fails
+        """
+        for row in self._iter_rows(_SQL_GET_ALL):
+            yield SkillInfo(*row)
+
+    def _iter_rows(self, sql: str) -> Iterator[tuple]:
+        """Stream raw result rows of a query on a short-lived read connection.
+
+        The open cursor pins its connection's read snapshot (and holds back
+        WAL checkpoints) until it is closed, so it gets a connection of its
+        own instead of the shared reader, and both are closed as soon as the
+        iterator finishes or is discarded.
+
+        Args:
+            sql: Query to run
+
+        Yields:
+            Result rows as tuples
+
+        Raises:
+            sqlite3.Error: If the query fails
+        """
+        conn = sqlite3.connect(self._ro_uri, uri=True, timeout=self._busy_timeout)
+        try:
+            cursor = conn.execute(sql)
+            try:
+                while True:
+                    rows = cursor.fetchmany(_FETCH_BATCH)
+                    if not rows:
+                        break
+                    yield from rows
+            finally:
+                cursor.close()
         finally:
             conn.close()
 
@@ -615,49 +1285,34 @@ class Tracker:
         Returns:
             List of SkillInfo objects from the repository
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            try:
+                cursor = conn.execute(_SQL_GET_BY_REPO, (repo_name,))
 
-        try:
-            cursor.execute("""
-                SELECT file_hash, source_repo, source_path, source_url,
-                       skill_name, category, subcategory, processed_at, local_path,
-                       source_created_at, source_updated_at, repo_stars, repo_forks,
-                       repo_last_synced, repo_description, health_status, last_health_check
-                FROM processed_skills
-                WHERE source_repo = ?
-                ORDER BY processed_at DESC
-            """, (repo_name,))
-
-            results = []
-            for row in cursor.fetchall():
-                results.append(SkillInfo(
-                    file_hash=row[0],
-                    source_repo=row[1],
-                    source_path=row[2],
-                    source_url=row[3],
-                    skill_name=row[4] or "",
-                    category=row[5] or "",
-                    subcategory=row[6] or "",
-                    processed_at=row[7],
-                    local_path=row[8],
-                    source_created_at=row[9],
-                    source_updated_at=row[10],
-                    repo_stars=row[11],
-                    repo_forks=row[12],
-                    repo_last_synced=row[13],
-                    repo_description=row[14],
-                    health_status=row[15],
-                    last_health_check=row[16],
-                ))
+                return [SkillInfo(*row) for row in cursor]
 
-            return results
+            except sqlite3.Error as e:
+                logger.error(f"Database query error: {e}")
+                return []
 
-        except sqlite3.Error as e:
-            logger.error(f"Database query error: {e}")
-            return []
-        finally:
-            conn.close()
+    def get_hashes_by_repo(self, repo_name: str) -> List[str]:
+        """Get the content hashes of all processed skills from a repository.
+
+        Answered from the source_repo index alone, without reading table rows.
+
+        Args:
+            repo_name: Repository full name (e.g., "user/repo")
+
+        Returns:
+            List of file hashes
+        """
+        with self._reader() as conn:
+            try:
+                return [row[0] for row in conn.execute(_SQL_HASHES_BY_REPO, (repo_name,))]
+
+            except sqlite3.Error as e:
+                logger.error(f"Database query error: {e}")
+                return []
 
     def get_stats(self) -> dict:
         """Get statistics about processed skills.
@@ -665,63 +1320,128 @@ class Tracker:
         Returns:
             Dictionary with statistics
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+
+            try:
+                # Per-category and top-repo counts in one round-trip, tagged by
+                # kind; the total is the sum of the per-category counts
+                by_category = {}
+                top_repos = {}
+                for kind, key, count in cursor.execute(_SQL_STATS):
+                    if kind == "category":
+                        by_category[key] = count
+                    else:
+                        top_repos[key] = count
+                total = sum(by_category.values())
+
+                return {
+                    "total_skills": total,
+                    "by_category": by_category,
+                    "top_repos": top_repos,
+                }
+
+            except sqlite3.Error as e:
+                logger.error(f"Database query error: {e}")
+                return {}
+
+    def _save_backup(self) -> None:
+        """Snapshot the database to the backup file.
+
+        Uses SQLite's online backup API, which copies pages directly
+        instead of reading every row back into Python. The copy is taken
+        from a short-lived read-only connection of its own, so neither
+        writers nor the shared reader are blocked while it runs; writes
+        committed after it starts mark the tracker dirty again for the
+        next backup.
+        """
+        with self._lock:
+            self._dirty = False
+            self._last_backup_ts = time.monotonic()
 
         try:
-            # Total count
-            cursor.execute("SELECT COUNT(*) FROM processed_skills")
-            total = cursor.fetchone()[0]
-
-            # Count by category
-            cursor.execute("""
-                SELECT category, COUNT(*)
-                FROM processed_skills
-                GROUP BY category
-                ORDER BY COUNT(*) DESC
-            """)
-            by_category = dict(cursor.fetchall())
-
-            # Count by source repo
-            cursor.execute("""
-                SELECT source_repo, COUNT(*)
-                FROM processed_skills
-                GROUP BY source_repo
-                ORDER BY COUNT(*) DESC
-                LIMIT 10
-            """)
-            top_repos = dict(cursor.fetchall())
-
-            return {
-                "total_skills": total,
-                "by_category": by_category,
-                "top_repos": top_repos,
-            }
+            source_conn = sqlite3.connect(self._ro_uri, uri=True, timeout=self._busy_timeout)
+            backup_conn = sqlite3.connect(self.backup_path)
+            try:
+                source_conn.backup(backup_conn)
+            finally:
+                backup_conn.close()
+                source_conn.close()
+
+            logger.debug(f"Saved database backup to {self.backup_path}")
 
         except sqlite3.Error as e:
-            logger.error(f"Database query error: {e}")
-            return {}
-        finally:
-            conn.close()
+            with self._lock:
+                self._dirty = True
+            logger.warning(f"Could not save database backup: {e}")
 
-    def _save_json_backup(self) -> None:
-        """Save a JSON backup of the database."""
-        try:
-            skills = self.get_all_processed()
-            data = [asdict(skill) for skill in skills]
+    def export_json(self, path: Optional[Path] = None) -> int:
+        """Export all processed skills to a JSON file.
+
+        Args:
+            path: Output file (defaults to the tracker's JSON path)
 
-            # Write to temporary file first
-            temp_path = self.json_path.with_suffix(".json.tmp")
-            with open(temp_path, "w") as f:
-                json.dump(data, f, indent=2)
+        Returns:
+            Number of records written, or -1 on error
+        """
+        path = path or self.json_path
+        try:
+            # Stream records into a JSON array, one object per line, so the
+            # whole table is never held in memory. Rows go straight to dicts
+            # keyed by SkillInfo's fields without building SkillInfo objects.
+            temp_path = path.with_suffix(path.suffix + ".tmp")
+            count = 0
+            with open(temp_path, "wb") as f:
+                f.write(b"[")
+                for row in self._iter_rows(_SQL_GET_ALL):
+                    f.write(b",\n" if count else b"\n")
+                    f.write(_dump_json(dict(zip(_SKILL_FIELDS, row))))
+                    count += 1
+                f.write(b"\n]\n")
 
             # Rename to actual path
-            temp_path.replace(self.json_path)
+            temp_path.replace(path)
+
+            logger.debug(f"Exported {count} records to {path}")
+            return count
+
+        except (IOError, TypeError, OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not export JSON: {e}")
+            return -1
+
+    def _backup_if_due(self) -> None:
+        """Record a write and start a background backup if the last one is old enough."""
+        if not self._backup_enabled:
+            return
+
+        with self._lock:
+            self._dirty = True
+            if time.monotonic() - self._last_backup_ts < self._backup_interval:
+                return
+            if self._backup_thread is not None and self._backup_thread.is_alive():
+                return
 
-            logger.debug(f"Saved JSON backup with {len(data)} records")
+            self._last_backup_ts = time.monotonic()
+            self._backup_thread = threading.Thread(
+                target=self._save_backup,
+                name="tracker-backup",
+                daemon=True,
+            )
+            self._backup_thread.start()
 
-        except (IOError, TypeError, OSError) as e:
-            logger.warning(f"Could not save JSON backup: {e}")
+    def flush(self) -> None:
+        """Refresh the backup now if there are writes it doesn't reflect yet.
+
+        Waits for a background backup in progress before checking.
+        """
+        thread = self._backup_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+        with self._lock:
+            dirty = self._dirty
+        if dirty:
+            self._save_backup()
 
     def remove_skill(self, file_hash: str) -> bool:
         """Remove a skill from the tracker.
@@ -732,25 +1452,22 @@ class Tracker:
         Returns:
             True if successful, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            try:
+                cursor = self._conn.execute(_SQL_DELETE, (file_hash,))
+                self._backup_if_due()
 
-        try:
-            cursor.execute("DELETE FROM processed_skills WHERE file_hash = ?", (file_hash,))
-            conn.commit()
-            self._save_json_backup()
+                deleted = cursor.rowcount > 0
+                if deleted:
+                    if self._seen_hashes is not None:
+                        self._seen_hashes.discard(file_hash)
+                    logger.debug(f"Removed skill with hash: {file_hash}")
 
-            deleted = cursor.rowcount > 0
-            if deleted:
-                logger.debug(f"Removed skill with hash: {file_hash}")
+                return deleted
 
-            return deleted
-
-        except sqlite3.Error as e:
-            logger.error(f"Database delete error: {e}")
-            return False
-        finally:
-            conn.close()
+            except sqlite3.Error as e:
+                logger.error(f"Database delete error: {e}")
+                return False
 
     def get_skill_by_source_path(self, source_path: str) -> Optional[SkillInfo]:
         """Get a skill by its source path (for update detection).
@@ -761,54 +1478,42 @@ class Tracker:
         Returns:
             SkillInfo if found, None otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            try:
+                row = conn.execute(_SQL_GET_BY_SOURCE_PATH, (source_path,)).fetchone()
+                return SkillInfo(*row) if row else None
 
-        try:
-            cursor.execute("""
-                SELECT file_hash, source_repo, source_path, source_url,
-                       skill_name, category, subcategory, processed_at, local_path,
-                       source_created_at, source_updated_at, repo_stars, repo_forks,
-                       repo_last_synced, repo_description, health_status, last_health_check
-                FROM processed_skills
-                WHERE source_path = ?
-                LIMIT 1
-            """, (source_path,))
-
-            row = cursor.fetchone()
-            if row:
-                return SkillInfo(
-                    file_hash=row[0],
-                    source_repo=row[1],
-                    source_path=row[2],
-                    source_url=row[3],
-                    skill_name=row[4] or "",
-                    category=row[5] or "",
-                    subcategory=row[6] or "",
-                    processed_at=row[7],
-                    local_path=row[8],
-                    source_created_at=row[9],
-                    source_updated_at=row[10],
-                    repo_stars=row[11],
-                    repo_forks=row[12],
-                    repo_last_synced=row[13],
-                    repo_description=row[14],
-                    health_status=row[15],
-                    last_health_check=row[16],
-                )
-            return None
+            except sqlite3.Error as e:
+                logger.error(f"Database query error: {e}")
+                return None
 
-        except sqlite3.Error as e:
-            logger.error(f"Database query error: {e}")
-            return None
-        finally:
-            conn.close()
+    def get_hash_by_source_path(self, source_path: str) -> Optional[str]:
+        """Get the stored content hash for a source path.
+
+        Cheaper than get_skill_by_source_path() when only the hash is needed
+        for change detection: the lookup is served from the covering index.
+
+        Args:
+            source_path: The source file path in the original repository
+
+        Returns:
+            File hash if found, None otherwise
+        """
+        with self._reader() as conn:
+            try:
+                row = conn.execute(_SQL_HASH_BY_SOURCE_PATH, (source_path,)).fetchone()
+                return row[0] if row else None
+
+            except sqlite3.Error as e:
+                logger.error(f"Database query error: {e}")
+                return None
 
     def update_skill_hash(self, source_path: str, new_file_hash: str, new_content_data: dict) -> bool:
         """Update a skill when its content has changed.
 
         This is used when a source file is updated - we track it by source_path
-        and update the hash and related metadata.
+        and update the hash and related metadata. If the stored hash already
+        matches, nothing is written.
 
         Args:
             source_path: The source file path
@@ -816,55 +1521,54 @@ class Tracker:
             new_content_data: New metadata dictionary
 
         Returns:
-            True if updated, False otherwise
+            True if updated, False otherwise (including unchanged content)
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
 
-        try:
-            cursor.execute("""
-                UPDATE processed_skills
-                SET file_hash = ?,
-                    skill_name = ?,
-                    processed_at = ?,
-                    source_created_at = ?,
-                    source_updated_at = ?,
-                    repo_stars = ?,
-                    repo_forks = ?,
-                    repo_last_synced = ?,
-                    repo_description = ?,
-                    health_status = ?,
-                    last_health_check = ?
-                WHERE source_path = ?
-            """, (
-                new_file_hash,
-                new_content_data.get('skill_name'),
-                new_content_data.get('processed_at', datetime.utcnow().isoformat()),
-                new_content_data.get('source_created_at'),
-                new_content_data.get('source_updated_at'),
-                new_content_data.get('repo_stars'),
-                new_content_data.get('repo_forks'),
-                new_content_data.get('repo_last_synced', datetime.utcnow().isoformat()),
-                new_content_data.get('repo_description'),
-                new_content_data.get('health_status', 'unknown'),
-                new_content_data.get('last_health_check'),
-                source_path,
-            ))
-
-            conn.commit()
-            self._save_json_backup()
-
-            updated = cursor.rowcount > 0
-            if updated:
-                logger.debug(f"Updated skill hash for {source_path}: {new_file_hash}")
-
-            return updated
+            try:
+                # Re-scans mostly find unchanged files; skip the write (and the
+                # backup it would schedule) unless some row has a different hash
+                cursor.execute(_SQL_HASH_CHANGED, (source_path, new_file_hash))
+                if cursor.fetchone() is None:
+                    return False
+
+                # Hashes being replaced, so the processed-hash set can drop them
+                old_hashes: List[str] = []
+                if self._seen_hashes is not None:
+                    cursor.execute(_SQL_HASHES_BY_SOURCE_PATH, (source_path,))
+                    old_hashes = [row[0] for row in cursor.fetchall()]
+
+                now = datetime.utcnow().isoformat()
+                cursor.execute(_SQL_UPDATE_HASH, (
+                    new_file_hash,
+                    new_content_data.get('skill_name'),
+                    new_content_data.get('processed_at', now),
+                    new_content_data.get('source_created_at'),
+                    new_content_data.get('source_updated_at'),
+                    new_content_data.get('repo_stars'),
+                    new_content_data.get('repo_forks'),
+                    new_content_data.get('repo_last_synced', now),
+                    new_content_data.get('repo_description'),
+                    new_content_data.get('health_status', 'unknown'),
+                    new_content_data.get('last_health_check'),
+                    source_path,
+                ))
 
-        except sqlite3.Error as e:
-            logger.error(f"Database update error: {e}")
-            return False
-        finally:
-            conn.close()
+                self._backup_if_due()
+
+                updated = cursor.rowcount > 0
+                if updated:
+                    if self._seen_hashes is not None:
+                        self._seen_hashes.difference_update(old_hashes)
+                        self._seen_hashes.add(new_file_hash)
+                    logger.debug(f"Updated skill hash for {source_path}: {new_file_hash}")
+
+                return updated
+
+            except sqlite3.Error as e:
+                logger.error(f"Database update error: {e}")
+                return False
 
     # ========== Issue Tracking Methods ==========
 
@@ -877,43 +1581,32 @@ class Tracker:
         Returns:
             True if successful, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        return self.add_issues([issue_info]) == 1
 
-        try:
-            cursor.execute("""
-                INSERT OR REPLACE INTO issues
-                (issue_number, issue_title, issue_body, issue_state, issue_author,
-                 created_at, updated_at, processed_at, processing_status, labels,
-                 analysis_result, filter_reason, update_plan, error_message, local_created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                issue_info.issue_number,
-                issue_info.issue_title,
-                issue_info.issue_body,
-                issue_info.issue_state,
-                issue_info.issue_author,
-                issue_info.created_at,
-                issue_info.updated_at,
-                issue_info.processed_at,
-                issue_info.processing_status,
-                issue_info.labels,
-                issue_info.analysis_result,
-                issue_info.filter_reason,
-                issue_info.update_plan,
-                issue_info.error_message,
-                issue_info.local_created_at or datetime.utcnow().isoformat(),
-            ))
-
-            conn.commit()
-            logger.debug(f"Added/updated issue #{issue_info.issue_number}")
-            return True
+    def add_issues(self, issues: List[IssueInfo]) -> int:
+        """Add or update several issues in a single transaction.
+
+        Args:
+            issues: Issue information to add/update
 
+        Returns:
+            Number of issues written (0 on error)
+        """
+        if not issues:
+            return 0
+
+        default_ts = datetime.utcnow().isoformat()
+        try:
+            with self._transaction():
+                self._conn.executemany(
+                    _SQL_INSERT_ISSUE, [_issue_row(issue, default_ts) for issue in issues]
+                )
         except sqlite3.Error as e:
             logger.error(f"Database insert error for issue: {e}")
-            return False
-        finally:
-            conn.close()
+            return 0
+
+        logger.debug(f"Added/updated {len(issues)} issues")
+        return len(issues)
 
     def get_issue(self, issue_number: int) -> Optional[IssueInfo]:
         """Get an issue by its number.
@@ -924,92 +1617,40 @@ class Tracker:
         Returns:
             IssueInfo if found, None otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        try:
-            cursor.execute("""
-                SELECT issue_number, issue_title, issue_body, issue_state, issue_author,
-                       created_at, updated_at, processed_at, processing_status, labels,
-                       analysis_result, filter_reason, update_plan, error_message, local_created_at
-                FROM issues WHERE issue_number = ?
-            """, (issue_number,))
-
-            row = cursor.fetchone()
-            if row:
-                return IssueInfo(
-                    issue_number=row[0],
-                    issue_title=row[1],
-                    issue_body=row[2],
-                    issue_state=row[3],
-                    issue_author=row[4],
-                    created_at=row[5],
-                    updated_at=row[6],
-                    processed_at=row[7],
-                    processing_status=row[8],
-                    labels=row[9],
-                    analysis_result=row[10],
-                    filter_reason=row[11],
-                    update_plan=row[12],
-                    error_message=row[13],
-                    local_created_at=row[14],
-                )
-            return None
+            try:
+                cursor.execute(_SQL_GET_ISSUE, (issue_number,))
 
-        except sqlite3.Error as e:
-            logger.error(f"Database query error: {e}")
-            return None
-        finally:
-            conn.close()
+                row = cursor.fetchone()
+                return IssueInfo(*row) if row else None
 
-    def get_pending_issues(self, status: str = "pending") -> List[IssueInfo]:
+            except sqlite3.Error as e:
+                logger.error(f"Database query error: {e}")
+                return None
+
+    def get_pending_issues(self, status: str = "pending", limit: Optional[int] = None) -> List[IssueInfo]:
         """Get issues with a specific status.
 
         Args:
             status: Processing status to filter by (default: pending)
+            limit: Maximum number of issues to return, oldest first (default: all)
 
         Returns:
             List of IssueInfo objects
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        try:
-            cursor.execute("""
-                SELECT issue_number, issue_title, issue_body, issue_state, issue_author,
-                       created_at, updated_at, processed_at, processing_status, labels,
-                       analysis_result, filter_reason, update_plan, error_message, local_created_at
-                FROM issues WHERE processing_status = ?
-                ORDER BY created_at ASC
-            """, (status,))
-
-            results = []
-            for row in cursor.fetchall():
-                results.append(IssueInfo(
-                    issue_number=row[0],
-                    issue_title=row[1],
-                    issue_body=row[2],
-                    issue_state=row[3],
-                    issue_author=row[4],
-                    created_at=row[5],
-                    updated_at=row[6],
-                    processed_at=row[7],
-                    processing_status=row[8],
-                    labels=row[9],
-                    analysis_result=row[10],
-                    filter_reason=row[11],
-                    update_plan=row[12],
-                    error_message=row[13],
-                    local_created_at=row[14],
-                ))
+            try:
+                cursor.execute(_SQL_GET_ISSUES_BY_STATUS, (status, -1 if limit is None else limit))
 
-            return results
+                return [IssueInfo(*row) for row in cursor]
 
-        except sqlite3.Error as e:
-            logger.error(f"Database query error: {e}")
-            return []
-        finally:
-            conn.close()
+            except sqlite3.Error as e:
+                logger.error(f"Database query error: {e}")
+                return []
 
     def update_issue_status(self, issue_number: int, status: str, **kwargs) -> bool:
         """Update issue processing status.
@@ -1022,45 +1663,21 @@ class Tracker:
         Returns:
             True if successful, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
 
-        try:
-            update_fields = ["processing_status = ?"]
-            values = [status]
-
-            if 'processed_at' in kwargs:
-                update_fields.append("processed_at = ?")
-                values.append(kwargs['processed_at'])
-            if 'analysis_result' in kwargs:
-                update_fields.append("analysis_result = ?")
-                values.append(kwargs['analysis_result'])
-            if 'filter_reason' in kwargs:
-                update_fields.append("filter_reason = ?")
-                values.append(kwargs['filter_reason'])
-            if 'update_plan' in kwargs:
-                update_fields.append("update_plan = ?")
-                values.append(kwargs['update_plan'])
-            if 'error_message' in kwargs:
-                update_fields.append("error_message = ?")
-                values.append(kwargs['error_message'])
-
-            values.append(issue_number)
-
-            cursor.execute(f"""
-                UPDATE issues SET {', '.join(update_fields)}
-                WHERE issue_number = ?
-            """, values)
-
-            conn.commit()
-            logger.debug(f"Updated issue #{issue_number} status to {status}")
-            return True
+            try:
+                cursor.execute(
+                    _SQL_UPDATE_ISSUE,
+                    _status_update_params(status, issue_number, _ISSUE_UPDATE_FIELDS, kwargs),
+                )
 
-        except sqlite3.Error as e:
-            logger.error(f"Database update error: {e}")
-            return False
-        finally:
-            conn.close()
+                logger.debug(f"Updated issue #{issue_number} status to {status}")
+                return True
+
+            except sqlite3.Error as e:
+                logger.error(f"Database update error: {e}")
+                return False
 
     # ========== Update Plan Methods ==========
 
@@ -1073,34 +1690,27 @@ class Tracker:
         Returns:
             Plan ID if successful, -1 otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
 
-        try:
-            cursor.execute("""
-                INSERT INTO update_plans
-                (plan_type, source_issue, plan_data, execution_status, created_at, executed_at, execution_result)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                plan_info.plan_type,
-                plan_info.source_issue,
-                plan_info.plan_data,
-                plan_info.execution_status,
-                plan_info.created_at or datetime.utcnow().isoformat(),
-                plan_info.executed_at,
-                plan_info.execution_result,
-            ))
-
-            conn.commit()
-            plan_id = cursor.lastrowid
-            logger.debug(f"Added update plan #{plan_id}")
-            return plan_id
+            try:
+                cursor.execute(_SQL_INSERT_PLAN, (
+                    plan_info.plan_type,
+                    plan_info.source_issue,
+                    plan_info.plan_data,
+                    plan_info.execution_status,
+                    plan_info.created_at or datetime.utcnow().isoformat(),
+                    plan_info.executed_at,
+                    plan_info.execution_result,
+                ))
 
-        except sqlite3.Error as e:
-            logger.error(f"Database insert error for plan: {e}")
-            return -1
-        finally:
-            conn.close()
+                plan_id = cursor.lastrowid
+                logger.debug(f"Added update plan #{plan_id}")
+                return plan_id
+
+            except sqlite3.Error as e:
+                logger.error(f"Database insert error for plan: {e}")
+                return -1
 
     def get_pending_plans(self) -> List[UpdatePlanInfo]:
         """Get all pending update plans.
@@ -1108,36 +1718,17 @@ class Tracker:
         Returns:
             List of UpdatePlanInfo objects
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        try:
-            cursor.execute("""
-                SELECT plan_id, plan_type, source_issue, plan_data, execution_status, created_at, executed_at, execution_result
-                FROM update_plans WHERE execution_status = 'pending'
-                ORDER BY created_at ASC
-            """)
-
-            results = []
-            for row in cursor.fetchall():
-                results.append(UpdatePlanInfo(
-                    plan_id=row[0],
-                    plan_type=row[1],
-                    source_issue=row[2],
-                    plan_data=row[3],
-                    execution_status=row[4],
-                    created_at=row[5],
-                    executed_at=row[6],
-                    execution_result=row[7],
-                ))
+            try:
+                cursor.execute(_SQL_GET_PENDING_PLANS)
 
-            return results
+                return [UpdatePlanInfo(*row) for row in cursor]
 
-        except sqlite3.Error as e:
-            logger.error(f"Database query error: {e}")
-            return []
-        finally:
-            conn.close()
+            except sqlite3.Error as e:
+                logger.error(f"Database query error: {e}")
+                return []
 
     def update_plan_status(self, plan_id: int, status: str, execution_result: str = None) -> bool:
         """Update plan execution status.
@@ -1150,32 +1741,18 @@ class Tracker:
         Returns:
             True if successful, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
 
-        try:
-            if execution_result:
-                cursor.execute("""
-                    UPDATE update_plans
-                    SET execution_status = ?, executed_at = ?, execution_result = ?
-                    WHERE plan_id = ?
-                """, (status, datetime.utcnow().isoformat(), execution_result, plan_id))
-            else:
-                cursor.execute("""
-                    UPDATE update_plans
-                    SET execution_status = ?, executed_at = ?
-                    WHERE plan_id = ?
-                """, (status, datetime.utcnow().isoformat(), plan_id))
-
-            conn.commit()
-            logger.debug(f"Updated plan #{plan_id} status to {status}")
-            return True
+            try:
+                cursor.execute(_SQL_UPDATE_PLAN, (status, execution_result or None, plan_id))
 
-        except sqlite3.Error as e:
-            logger.error(f"Database update error: {e}")
-            return False
-        finally:
-            conn.close()
+                logger.debug(f"Updated plan #{plan_id} status to {status}")
+                return True
+
+            except sqlite3.Error as e:
+                logger.error(f"Database update error: {e}")
+                return False
 
     # ========== PR Tracking Methods ==========
 
@@ -1188,42 +1765,30 @@ class Tracker:
         Returns:
             True if successful, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        return self.add_prs([pr_info]) == 1
 
-        try:
-            cursor.execute("""
-                INSERT OR REPLACE INTO pull_requests
-                (pr_number, pr_title, pr_author, pr_state, head_ref, base_ref,
-                 created_at, updated_at, processed_at, processing_status,
-                 validation_results, skill_files_added, error_message, local_created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                pr_info.pr_number,
-                pr_info.pr_title,
-                pr_info.pr_author,
-                pr_info.pr_state,
-                pr_info.head_ref,
-                pr_info.base_ref,
-                pr_info.created_at,
-                pr_info.updated_at,
-                pr_info.processed_at,
-                pr_info.processing_status,
-                pr_info.validation_results,
-                pr_info.skill_files_added,
-                pr_info.error_message,
-                pr_info.local_created_at or datetime.utcnow().isoformat(),
-            ))
-
-            conn.commit()
-            logger.debug(f"Added/updated PR #{pr_info.pr_number}")
-            return True
+    def add_prs(self, prs: List[PRInfo]) -> int:
+        """Add or update several PRs in a single transaction.
+
+        Args:
+            prs: PR information to add/update
 
+        Returns:
+            Number of PRs written (0 on error)
+        """
+        if not prs:
+            return 0
+
+        default_ts = datetime.utcnow().isoformat()
+        try:
+            with self._transaction():
+                self._conn.executemany(_SQL_INSERT_PR, [_pr_row(pr, default_ts) for pr in prs])
         except sqlite3.Error as e:
             logger.error(f"Database insert error for PR: {e}")
-            return False
-        finally:
-            conn.close()
+            return 0
+
+        logger.debug(f"Added/updated {len(prs)} PRs")
+        return len(prs)
 
     def get_pr(self, pr_number: int) -> Optional[PRInfo]:
         """Get a PR by its number.
@@ -1234,90 +1799,40 @@ class Tracker:
         Returns:
             PRInfo if found, None otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        try:
-            cursor.execute("""
-                SELECT pr_number, pr_title, pr_author, pr_state, head_ref, base_ref,
-                       created_at, updated_at, processed_at, processing_status,
-                       validation_results, skill_files_added, error_message, local_created_at
-                FROM pull_requests WHERE pr_number = ?
-            """, (pr_number,))
-
-            row = cursor.fetchone()
-            if row:
-                return PRInfo(
-                    pr_number=row[0],
-                    pr_title=row[1],
-                    pr_author=row[2],
-                    pr_state=row[3],
-                    head_ref=row[4],
-                    base_ref=row[5],
-                    created_at=row[6],
-                    updated_at=row[7],
-                    processed_at=row[8],
-                    processing_status=row[9],
-                    validation_results=row[10],
-                    skill_files_added=row[11],
-                    error_message=row[12],
-                    local_created_at=row[13],
-                )
-            return None
+            try:
+                cursor.execute(_SQL_GET_PR, (pr_number,))
 
-        except sqlite3.Error as e:
-            logger.error(f"Database query error: {e}")
-            return None
-        finally:
-            conn.close()
+                row = cursor.fetchone()
+                return PRInfo(*row) if row else None
+
+            except sqlite3.Error as e:
+                logger.error(f"Database query error: {e}")
+                return None
 
-    def get_pending_prs(self, status: str = "pending") -> List[PRInfo]:
+    def get_pending_prs(self, status: str = "pending", limit: Optional[int] = None) -> List[PRInfo]:
         """Get PRs with a specific status.
 
         Args:
             status: Processing status to filter by (default: pending)
+            limit: Maximum number of PRs to return, oldest first (default: all)
 
         Returns:
             List of PRInfo objects
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        try:
-            cursor.execute("""
-                SELECT pr_number, pr_title, pr_author, pr_state, head_ref, base_ref,
-                       created_at, updated_at, processed_at, processing_status,
-                       validation_results, skill_files_added, error_message, local_created_at
-                FROM pull_requests WHERE processing_status = ?
-                ORDER BY created_at ASC
-            """, (status,))
-
-            results = []
-            for row in cursor.fetchall():
-                results.append(PRInfo(
-                    pr_number=row[0],
-                    pr_title=row[1],
-                    pr_author=row[2],
-                    pr_state=row[3],
-                    head_ref=row[4],
-                    base_ref=row[5],
-                    created_at=row[6],
-                    updated_at=row[7],
-                    processed_at=row[8],
-                    processing_status=row[9],
-                    validation_results=row[10],
-                    skill_files_added=row[11],
-                    error_message=row[12],
-                    local_created_at=row[13],
-                ))
+            try:
+                cursor.execute(_SQL_GET_PRS_BY_STATUS, (status, -1 if limit is None else limit))
 
-            return results
+                return [PRInfo(*row) for row in cursor]
 
-        except sqlite3.Error as e:
-            logger.error(f"Database query error: {e}")
-            return []
-        finally:
-            conn.close()
+            except sqlite3.Error as e:
+                logger.error(f"Database query error: {e}")
+                return []
 
     def update_pr_status(self, pr_number: int, status: str, **kwargs) -> bool:
         """Update PR processing status.
@@ -1330,42 +1845,21 @@ class Tracker:
         Returns:
             True if successful, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
 
-        try:
-            update_fields = ["processing_status = ?"]
-            values = [status]
-
-            if 'processed_at' in kwargs:
-                update_fields.append("processed_at = ?")
-                values.append(kwargs['processed_at'])
-            if 'validation_results' in kwargs:
-                update_fields.append("validation_results = ?")
-                values.append(kwargs['validation_results'])
-            if 'skill_files_added' in kwargs:
-                update_fields.append("skill_files_added = ?")
-                values.append(kwargs['skill_files_added'])
-            if 'error_message' in kwargs:
-                update_fields.append("error_message = ?")
-                values.append(kwargs['error_message'])
-
-            values.append(pr_number)
-
-            cursor.execute(f"""
-                UPDATE pull_requests SET {', '.join(update_fields)}
-                WHERE pr_number = ?
-            """, values)
-
-            conn.commit()
-            logger.debug(f"Updated PR #{pr_number} status to {status}")
-            return True
+            try:
+                cursor.execute(
+                    _SQL_UPDATE_PR,
+                    _status_update_params(status, pr_number, _PR_UPDATE_FIELDS, kwargs),
+                )
 
-        except sqlite3.Error as e:
-            logger.error(f"Database update error: {e}")
-            return False
-        finally:
-            conn.close()
+                logger.debug(f"Updated PR #{pr_number} status to {status}")
+                return True
+
+            except sqlite3.Error as e:
+                logger.error(f"Database update error: {e}")
+                return False
 
     # ========== Health Check Methods ==========
 
@@ -1382,31 +1876,56 @@ class Tracker:
         Returns:
             Check ID if successful, -1 otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
+        checked_at = datetime.utcnow().isoformat()
         try:
-            checked_at = datetime.utcnow().isoformat()
-            cursor.execute("""
-                INSERT INTO health_checks
-                (check_type, skill_id, check_result, check_details, checked_at)
-                VALUES (?, ?, ?, ?, ?)
-            """, (check_type, skill_id, check_result, check_details, checked_at))
+            # The check and the skill's health status commit together
+            with self._transaction():
+                cursor = self._conn.execute(
+                    _SQL_INSERT_HEALTH_CHECK,
+                    (check_type, skill_id, check_result, check_details, checked_at),
+                )
+                self._conn.execute(_SQL_UPDATE_SKILL_HEALTH, (check_result, checked_at, skill_id))
+        except sqlite3.Error as e:
+            logger.error(f"Database insert error for health check: {e}")
+            return -1
 
-            conn.commit()
-            check_id = cursor.lastrowid
+        check_id = cursor.lastrowid
+        logger.debug(f"Added health check #{check_id} for skill {skill_id}")
+        return check_id
 
-            # Update skill health status
-            self.update_skill_health(skill_id, check_result, checked_at)
+    def add_health_checks(self, skill_id: str, checks: List[Tuple[str, str, Optional[str]]]) -> int:
+        """Add several health check results for one skill at once.
 
-            logger.debug(f"Added health check #{check_id} for skill {skill_id}")
-            return check_id
+        Equivalent to calling add_health_check() for each check in order,
+        but the rows and the skill's health status (taken from the last
+        check) are written in one transaction, updating the status once.
 
+        Args:
+            skill_id: File hash or local path of the skill
+            checks: (check_type, check_result, check_details) tuples
+
+        Returns:
+            Number of checks added, -1 on error
+        """
+        if not checks:
+            return 0
+
+        checked_at = datetime.utcnow().isoformat()
+        rows = [
+            (check_type, skill_id, check_result, check_details, checked_at)
+            for check_type, check_result, check_details in checks
+        ]
+        try:
+            with self._transaction():
+                self._conn.executemany(_SQL_INSERT_HEALTH_CHECK, rows)
+                self._conn.execute(_SQL_UPDATE_SKILL_HEALTH, (checks[-1][1], checked_at, skill_id))
         except sqlite3.Error as e:
-            logger.error(f"Database insert error for health check: {e}")
+            logger.error(f"Database insert error for health checks: {e}")
             return -1
-        finally:
-            conn.close()
+
+        added = len(rows)
+        logger.debug(f"Added {added} health checks for skill {skill_id}")
+        return added
 
     def get_latest_health_check(self, skill_id: str, check_type: str = None) -> Optional[HealthCheckResult]:
         """Get the latest health check for a skill.
@@ -1418,43 +1937,19 @@ class Tracker:
         Returns:
             HealthCheckResult if found, None otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        try:
-            if check_type:
-                cursor.execute("""
-                    SELECT check_id, check_type, skill_id, check_result, check_details, checked_at, created_at
-                    FROM health_checks
-                    WHERE skill_id = ? AND check_type = ?
-                    ORDER BY checked_at DESC LIMIT 1
-                """, (skill_id, check_type))
-            else:
-                cursor.execute("""
-                    SELECT check_id, check_type, skill_id, check_result, check_details, checked_at, created_at
-                    FROM health_checks
-                    WHERE skill_id = ?
-                    ORDER BY checked_at DESC LIMIT 1
-                """, (skill_id,))
-
-            row = cursor.fetchone()
-            if row:
-                return HealthCheckResult(
-                    check_id=row[0],
-                    check_type=row[1],
-                    skill_id=row[2],
-                    check_result=row[3],
-                    check_details=row[4],
-                    checked_at=row[5],
-                    created_at=row[6],
-                )
-            return None
+            try:
+                check_type = check_type or None
+                cursor.execute(_SQL_LATEST_HEALTH_CHECK, (skill_id, check_type, check_type))
 
-        except sqlite3.Error as e:
-            logger.error(f"Database query error: {e}")
-            return None
-        finally:
-            conn.close()
+                row = cursor.fetchone()
+                return HealthCheckResult(*row) if row else None
+
+            except sqlite3.Error as e:
+                logger.error(f"Database query error: {e}")
+                return None
 
     def update_skill_health(self, skill_id: str, health_status: str, checked_at: str) -> bool:
         """Update a skill's health status.
@@ -1467,24 +1962,17 @@ class Tracker:
         Returns:
             True if successful, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
 
-        try:
-            cursor.execute("""
-                UPDATE processed_skills
-                SET health_status = ?, last_health_check = ?
-                WHERE file_hash = ?
-            """, (health_status, checked_at, skill_id))
+            try:
+                cursor.execute(_SQL_UPDATE_SKILL_HEALTH, (health_status, checked_at, skill_id))
 
-            conn.commit()
-            return cursor.rowcount > 0
+                return cursor.rowcount > 0
 
-        except sqlite3.Error as e:
-            logger.error(f"Database update error: {e}")
-            return False
-        finally:
-            conn.close()
+            except sqlite3.Error as e:
+                logger.error(f"Database update error: {e}")
+                return False
 
     def get_unhealthy_skills(self, status: str = "failed") -> List[SkillInfo]:
         """Get skills with a specific health status.
@@ -1495,48 +1983,15 @@ class Tracker:
         Returns:
             List of SkillInfo objects
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        try:
-            cursor.execute("""
-                SELECT file_hash, source_repo, source_path, source_url,
-                       skill_name, category, subcategory, processed_at, local_path,
-                       source_created_at, source_updated_at, repo_stars, repo_forks,
-                       repo_last_synced, repo_description, health_status, last_health_check
-                FROM processed_skills WHERE health_status = ?
-                ORDER BY last_health_check DESC
-            """, (status,))
-
-            results = []
-            for row in cursor.fetchall():
-                results.append(SkillInfo(
-                    file_hash=row[0],
-                    source_repo=row[1],
-                    source_path=row[2],
-                    source_url=row[3],
-                    skill_name=row[4] or "",
-                    category=row[5] or "",
-                    subcategory=row[6] or "",
-                    processed_at=row[7],
-                    local_path=row[8],
-                    source_created_at=row[9],
-                    source_updated_at=row[10],
-                    repo_stars=row[11],
-                    repo_forks=row[12],
-                    repo_last_synced=row[13],
-                    repo_description=row[14],
-                    health_status=row[15],
-                    last_health_check=row[16],
-                ))
+        with self._reader() as conn:
+            try:
+                cursor = conn.execute(_SQL_GET_BY_HEALTH, (status,))
 
-            return results
+                return [SkillInfo(*row) for row in cursor]
 
-        except sqlite3.Error as e:
-            logger.error(f"Database query error: {e}")
-            return []
-        finally:
-            conn.close()
+            except sqlite3.Error as e:
+                logger.error(f"Database query error: {e}")
+                return []
 
     # ========== Webhook Event Methods ==========
 
@@ -1553,26 +2008,47 @@ class Tracker:
         Returns:
             Event ID if successful, -1 otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
 
-        try:
-            cursor.execute("""
-                INSERT INTO webhook_events
-                (event_type, repo_name, event_payload, received_at)
-                VALUES (?, ?, ?, ?)
-            """, (event_type, repo_name, event_payload, received_at or datetime.utcnow().isoformat()))
+            try:
+                cursor.execute(_SQL_INSERT_EVENT, (event_type, repo_name, event_payload, received_at or None))
+
+                event_id = cursor.lastrowid
+                logger.debug(f"Added webhook event #{event_id} ({event_type} from {repo_name})")
+                return event_id
+
+            except sqlite3.Error as e:
+                logger.error(f"Database insert error for webhook event: {e}")
+                return -1
 
-            conn.commit()
-            event_id = cursor.lastrowid
-            logger.debug(f"Added webhook event #{event_id} ({event_type} from {repo_name})")
-            return event_id
+    def add_webhook_events(self, events: List[Tuple[str, str, Optional[str], Optional[str]]]) -> int:
+        """Add several webhook events in a single transaction.
+
+        Args:
+            events: (event_type, repo_name, event_payload, received_at) tuples;
+                a None received_at defaults to now
+
+        Returns:
+            Number of events added, -1 on error
+        """
+        if not events:
+            return 0
 
+        rows = [
+            (event_type, repo_name, event_payload, received_at or None)
+            for event_type, repo_name, event_payload, received_at in events
+        ]
+        try:
+            with self._transaction():
+                self._conn.executemany(_SQL_INSERT_EVENT, rows)
         except sqlite3.Error as e:
-            logger.error(f"Database insert error for webhook event: {e}")
+            logger.error(f"Database insert error for webhook events: {e}")
             return -1
-        finally:
-            conn.close()
+
+        added = len(rows)
+        logger.debug(f"Added {added} webhook events")
+        return added
 
     def get_pending_events(self, max_retries: int = 3) -> List[WebhookEvent]:
         """Get pending webhook events.
@@ -1583,40 +2059,34 @@ class Tracker:
         Returns:
             List of WebhookEvent objects
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        try:
-            cursor.execute("""
-                SELECT event_id, event_type, repo_name, event_payload, received_at,
-                       processed_at, processing_status, retry_count, error_message, created_at
-                FROM webhook_events
-                WHERE processing_status = 'pending' OR (processing_status = 'failed' AND retry_count < ?)
-                ORDER BY created_at ASC
-            """, (max_retries,))
-
-            results = []
-            for row in cursor.fetchall():
-                results.append(WebhookEvent(
-                    event_id=row[0],
-                    event_type=row[1],
-                    repo_name=row[2],
-                    event_payload=row[3],
-                    received_at=row[4],
-                    processed_at=row[5],
-                    processing_status=row[6],
-                    retry_count=row[7],
-                    error_message=row[8],
-                    created_at=row[9],
-                ))
+            try:
+                cursor.execute(_SQL_GET_PENDING_EVENTS, (max_retries,))
 
-            return results
+                return [WebhookEvent(*row) for row in cursor]
 
-        except sqlite3.Error as e:
-            logger.error(f"Database query error: {e}")
-            return []
-        finally:
-            conn.close()
+            except sqlite3.Error as e:
+                logger.error(f"Database query error: {e}")
+                return []
+
+    def count_pending_events(self, max_retries: int = 3) -> int:
+        """Count the events get_pending_events() would return.
+
+        Args:
+            max_retries: Maximum retry count to include
+
+        Returns:
+            Number of pending events
+        """
+        with self._reader() as conn:
+            try:
+                return conn.execute(_SQL_COUNT_PENDING_EVENTS, (max_retries,)).fetchone()[0]
+
+            except sqlite3.Error as e:
+                logger.error(f"Database query error: {e}")
+                return 0
 
     def update_webhook_event(self, event_id: int, status: str,
                              error_message: str = None, increment_retry: bool = False) -> bool:
@@ -1631,32 +2101,18 @@ class Tracker:
         Returns:
             True if successful, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
 
-        try:
-            if increment_retry:
-                cursor.execute("""
-                    UPDATE webhook_events
-                    SET processing_status = ?, processed_at = ?, error_message = ?, retry_count = retry_count + 1
-                    WHERE event_id = ?
-                """, (status, datetime.utcnow().isoformat(), error_message, event_id))
-            else:
-                cursor.execute("""
-                    UPDATE webhook_events
-                    SET processing_status = ?, processed_at = ?, error_message = ?
-                    WHERE event_id = ?
-                """, (status, datetime.utcnow().isoformat(), error_message, event_id))
-
-            conn.commit()
-            logger.debug(f"Updated webhook event #{event_id} status to {status}")
-            return True
+            try:
+                cursor.execute(_SQL_UPDATE_EVENT, (status, error_message, int(increment_retry), event_id))
 
-        except sqlite3.Error as e:
-            logger.error(f"Database update error: {e}")
-            return False
-        finally:
-            conn.close()
+                logger.debug(f"Updated webhook event #{event_id} status to {status}")
+                return True
+
+            except sqlite3.Error as e:
+                logger.error(f"Database update error: {e}")
+                return False
 
     def mark_event_processed(self, event_id: int) -> bool:
         """Mark a webhook event as successfully processed.
@@ -1668,3 +2124,77 @@ class Tracker:
             True if successful, False otherwise
         """
         return self.update_webhook_event(event_id, "completed")
+
+    def close(self) -> None:
+        """Flush the backup and close the database connections."""
+        # Flush outside the lock: it may wait on the backup thread, which
+        # briefly needs the lock itself
+        self.flush()
+        with self._lock:
+            self._dirty = False
+            self._optimize()
+            if getattr(self, "_rconn", None) is not None:
+                self._rconn.close()
+            self._conn.close()
+
+    def _optimize(self) -> None:
+        """Let SQLite refresh planner statistics it considers stale."""
+        with self._lock:
+            try:
+                self._conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass  # Already closed
+
+    def __del__(self):
+        """Flush and close on destruction."""
+        if getattr(self, "_conn", None) is not None:
+            self.close()
+
+
+def _dump_json(obj) -> bytes:
+    """Serialize an object to compact JSON bytes, using orjson when available.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _is_json_array(f) -> bool:
+    """Check whether a binary JSON stream holds a top-level array.
+
+    Peeks at the first non-whitespace byte and rewinds the stream.
+
+    Args:
+        f: Binary file object positioned at the start
+
+    Returns:
+        True if the document starts with "["
+    """
+    char = f.read(1)
+    while char.isspace():
+        char = f.read(1)
+    f.seek(0)
+    return char == b"["
+
+
+def _flush_on_exit(tracker_ref: "weakref.ref[Tracker]") -> None:
+    """Flush a tracker's pending backup and optimize it at interpreter exit.
+
+    Entry points don't call close(), so this is where PRAGMA optimize runs
+    on shutdown. The connections are left open for any daemon threads still
+    using them. Registered with a weak reference so atexit doesn't keep
+    trackers alive.
+
+    Args:
+        tracker_ref: Weak reference to the tracker
+    """
+    tracker = tracker_ref()
+    if tracker is not None:
+        tracker.flush()
+        tracker._optimize()
@@ -85,9 +85,8 @@ def create_webhook_server(config: Config, tracker: Tracker) -> Flask:
     @app.route("/webhook/pending", methods=["GET"])
     def get_pending():
         """Get pending events count."""
-        pending = tracker.get_pending_events()
         return jsonify({
-            "pending_count": len(pending),
+            "pending_count": tracker.count_pending_events(),
         })
 
     @app.route("/webhook/stats", methods=["GET"])